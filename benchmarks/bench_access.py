@@ -0,0 +1,65 @@
+"""
+Cost of reading values out of a collected config
+"""
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+from fastargs.validation import And, Or, InRange
+
+
+def run(count=1_000, per_section=10):
+    config = Config()
+    set_current_config(config)
+    for i in range(count // per_section):
+        Section(f'bench.section{i}').params(**{
+            f'p{j}': Param(And(Or(int, float), InRange(min=0)), default=j)
+            for j in range(per_section)
+        })
+    paths = list(config.entries.keys())
+    dotted = ['.'.join(path) for path in paths]
+
+    def cold():
+        config.invalidate()
+        for path in dotted:
+            config[path]
+
+    def validate():
+        config.invalidate()
+        config.validate('errordict')
+
+    def warm():
+        for path in dotted:
+            config[path]
+
+    warm()
+    frozen = config.freeze()
+
+    def snapshot():
+        for path in dotted:
+            frozen[path]
+
+    nodes = [(frozen.bench[section], name) for _, section, name in paths]
+
+    def attributes():
+        for node, name in nodes:
+            getattr(node, name)
+
+    def nested():
+        for _ in range(count):
+            frozen.bench.section0.p0
+
+    return {
+        f'Config[path] uncached x{count}': measure(cold, repeat=3),
+        f'Config[path] x{count}': measure(warm),
+        f'FrozenConfig[path] x{count}': measure(snapshot),
+        f'getattr(FrozenConfig node, name) x{count}': measure(attributes),
+        f'FrozenConfig.a.b.c x{count}': measure(nested),
+        f'Config.validate() ({count} params)': measure(validate, repeat=3),
+        f'Config.get() ({count} params)': measure(config.get, repeat=3),
+        f'Config.freeze() ({count} params)': measure(config.freeze, repeat=3),
+    }
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
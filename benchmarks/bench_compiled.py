@@ -0,0 +1,69 @@
+"""
+Cost of getting a usable config in a worker process
+"""
+import os
+import pickle
+import tempfile
+
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+from fastargs.validation import And, InRange
+
+
+def declare(count, per_section=10):
+    config = Config()
+    set_current_config(config)
+    for i in range(count // per_section):
+        Section(f'bench.section{i}').params(**{
+            f'p{j}': Param(And(float, InRange(min=0)), default=0.0)
+            for j in range(per_section)
+        })
+    return config
+
+
+def run(count=1_000, per_section=10):
+    source = {
+        f'bench.section{i}.p{j}': i * j
+        for i in range(count // per_section) for j in range(per_section)
+    }
+    config = declare(count).collect(source)
+    data = pickle.dumps(config.compile())
+    folder = tempfile.TemporaryDirectory()
+    fname = os.path.join(folder.name, 'config.bin')
+    config.dump_binary(fname)
+
+    def recollect():
+        config = declare(count).collect(source)
+        for path in config.entries:
+            config[path]
+
+    def unpickle():
+        config = pickle.loads(data)
+        for path in config.entries:
+            config[path]
+
+    def load_binary():
+        config = Config.load_binary(fname)
+        for path in config.entries:
+            config[path]
+
+    def load_binary_single():
+        Config.load_binary(fname)['bench.section0.p0']
+
+    with folder:
+        return {
+            f'declare + collect + read ({count} params)': measure(
+                recollect, repeat=3),
+            f'unpickle compiled + read ({count} params)': measure(
+                unpickle, repeat=3),
+            f'load_binary + read ({count} params)': measure(
+                load_binary, repeat=3),
+            f'load_binary + read one value ({count} params)': measure(
+                load_binary_single, repeat=3),
+        }
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
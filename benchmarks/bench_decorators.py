@@ -0,0 +1,40 @@
+"""
+Overhead of calling a function through @param compared to a plain call
+"""
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+from fastargs.decorators import param, section
+
+
+def run():
+    set_current_config(Config())
+    Section('bench.decorators').params(
+        a=Param(int, default=1),
+        b=Param(float, default=2.0),
+        c=Param(str, default='c'),
+    )
+
+    def plain(a, b, c):
+        return a
+
+    @section('bench.decorators')
+    @param('a')
+    @param('b')
+    @param('c')
+    def decorated(a, b, c):
+        return a
+
+    bound = decorated.bind()
+
+    return {
+        'plain call': measure(lambda: plain(1, 2.0, 'c')),
+        '@param call': measure(decorated),
+        '@param call with override': measure(lambda: decorated(a=3)),
+        '@param bound call': measure(bound),
+    }
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
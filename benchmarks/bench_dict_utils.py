@@ -0,0 +1,45 @@
+"""
+Cost of expanding and collecting large sources
+"""
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+from fastargs.dict_utils import expand_keys, flatten_keys, recursive_get
+
+
+def make_source(size, width=10):
+    # Mix of dotted and nested keys, about `size` leaves
+    source = {}
+    for i in range(size // width):
+        source[f'section{i}'] = {f'sub.p{j}': j for j in range(width)}
+    return source
+
+
+def run(sizes=(10_000, 100_000)):
+    results = {}
+    for size in sizes:
+        source = make_source(size)
+        expanded = expand_keys(source)
+        paths = list(flatten_keys(source).keys())
+
+        config = Config()
+        set_current_config(config)
+        for i in range(size // 10):
+            Section(f'section{i}.sub').params(
+                **{f'p{j}': Param(int) for j in range(10)})
+
+        results[f'expand_keys ({size} keys)'] = measure(
+            lambda: expand_keys(source), repeat=3)
+        results[f'flatten_keys ({size} keys)'] = measure(
+            lambda: flatten_keys(source), repeat=3)
+        results[f'recursive_get x{size}'] = measure(
+            lambda: [recursive_get(expanded, p) for p in paths], repeat=3)
+        results[f'Config.collect ({size} keys)'] = measure(
+            lambda: config.collect(source), repeat=3)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
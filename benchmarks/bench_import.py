@@ -0,0 +1,29 @@
+"""
+Time to import fastargs in a fresh interpreter
+"""
+import subprocess
+import sys
+import time
+
+from utils import ROOT, report
+
+
+def interpreter_time(code, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=ROOT)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(repeat=10):
+    baseline = interpreter_time('pass', repeat)
+    return {
+        'import fastargs': interpreter_time('import fastargs', repeat) - baseline,
+    }
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
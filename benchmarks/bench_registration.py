@@ -0,0 +1,29 @@
+"""
+Cost of declaring sections and parameters
+"""
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+from fastargs.validation import And, InRange
+
+
+def declare(count, per_section=10):
+    set_current_config(Config())
+    for i in range(max(count // per_section, 1)):
+        Section(f'bench.section{i}').params(**{
+            f'p{j}': Param(And(int, InRange(min=0)), default=j)
+            for j in range(min(count, per_section))
+        })
+
+
+def run(sizes=(10, 1_000, 10_000)):
+    return {
+        f'Section().params() ({size} params)': measure(lambda: declare(size),
+                                                       repeat=3)
+        for size in sizes
+    }
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
@@ -0,0 +1,79 @@
+"""
+Cost of collecting values from the different sources
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+import yaml
+
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+
+
+def declare(count, per_section=10):
+    config = Config()
+    set_current_config(config)
+    for i in range(count // per_section):
+        Section(f'bench.section{i}').params(**{
+            f'p{j}': Param(float, default=0.0) for j in range(per_section)
+        })
+    return config
+
+
+def make_source(count, per_section=10):
+    return {
+        'bench': {
+            f'section{i}': {f'p{j}': i * j for j in range(per_section)}
+            for i in range(count // per_section)
+        }
+    }
+
+
+def run(count=1_000):
+    config = declare(count)
+    source = make_source(count)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'config.json')
+        yaml_path = os.path.join(tmp, 'config.yaml')
+        with open(json_path, 'w') as handle:
+            json.dump(source, handle)
+        with open(yaml_path, 'w') as handle:
+            yaml.dump(source, handle)
+
+        results[f'collect dict ({count} params)'] = measure(
+            lambda: config.collect(source), repeat=3)
+        results[f'collect_json ({count} params)'] = measure(
+            lambda: config.collect_json(json_path), repeat=3)
+        results[f'collect_yaml ({count} params)'] = measure(
+            lambda: config.collect_yaml(yaml_path), repeat=3)
+        results[f'collect_config_file yaml ({count} params)'] = measure(
+            lambda: config.collect_config_file(yaml_path), repeat=3)
+        results[f'collect_env_variables ({count} params)'] = measure(
+            config.collect_env_variables, repeat=3)
+
+        def cli():
+            parser = argparse.ArgumentParser()
+            argv = ['bench', '-C', json_path, '--bench.section0.p0=3']
+            with patch.object(sys, 'argv', argv):
+                config.augment_argparse(parser)
+                config.collect_argparse_args(parser)
+            return parser
+
+        results[f'augment_argparse + collect_argparse_args ({count} params)'] = \
+            measure(cli, repeat=3)
+        results[f'render --help ({count} params)'] = measure(
+            lambda: cli().format_help(), repeat=3)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
@@ -0,0 +1,49 @@
+"""
+Expanding a sweep compared to collecting one dict per trial
+"""
+import itertools
+
+from utils import measure, report
+
+from fastargs import Config, Section, Param, set_current_config
+from fastargs.sweep import grid
+
+LRS = [1e-4, 1e-3, 1e-2, 1e-1]
+BATCH_SIZES = [32, 64, 128, 256, 512]
+SEEDS = list(range(5))
+
+
+def run():
+    set_current_config(Config())
+    Section('training').params(
+        lr=Param(float, default=1e-3),
+        bs=Param(int, default=64),
+        seed=Param(int, default=0),
+        epochs=Param(int, default=10),
+    )
+    spec = {'training.lr': LRS, 'training.bs': BATCH_SIZES, 'training.seed': SEEDS}
+
+    def collect_each():
+        for lr, bs, seed in itertools.product(LRS, BATCH_SIZES, SEEDS):
+            cfg = Config()
+            Section('training', config_descriptor=cfg).params(
+                lr=Param(float), bs=Param(int), seed=Param(int),
+                epochs=Param(int, default=10),
+            )
+            cfg.collect({'training.lr': lr, 'training.bs': bs,
+                         'training.seed': seed})
+            cfg.get()
+
+    def sweep():
+        for trial in grid(spec):
+            trial.get()
+
+    return {
+        'collect + get per trial x100': measure(collect_each, number=10),
+        'grid + get x100': measure(sweep, number=10),
+    }
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        report(name, seconds)
@@ -0,0 +1,72 @@
+"""
+Run the fastargs benchmarks
+
+    python benchmarks/run.py                      # print the timings
+    python benchmarks/run.py --save results.json  # keep them for later
+    python benchmarks/run.py --compare results.json
+
+Timings are the best of several repetitions, --compare prints the ratio
+against a previous run (below 1 is faster).
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+
+from utils import ROOT, report
+
+SUITES = [
+    'bench_import',
+    'bench_registration',
+    'bench_sources',
+    'bench_access',
+    'bench_compiled',
+    'bench_decorators',
+    'bench_dict_utils',
+    'bench_sweep',
+]
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, cwd=ROOT,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='fastargs benchmarks')
+    parser.add_argument('suites', nargs='*', default=SUITES,
+                        help='Suites to run (default: all)')
+    parser.add_argument('--save', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Compare with a saved JSON file')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)['results']
+
+    results = {}
+    for suite in args.suites:
+        print(f'# {suite}')
+        for name, seconds in importlib.import_module(suite).run().items():
+            report(name, seconds, baseline.get(name))
+            results[name] = seconds
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump({
+                'revision': git_revision(),
+                'python': sys.version,
+                'platform': platform.platform(),
+                'results': results,
+            }, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import sys
+import timeit
+from os import path
+
+ROOT = path.dirname(path.dirname(path.realpath(__file__)))
+
+# Make the benchmarks runnable from a checkout without installing fastargs
+sys.path.insert(0, ROOT)
+
+
+def measure(func, repeat=5, number=None):
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(name, seconds, baseline=None):
+    line = f'{name:<60} {seconds * 1e6:>14.3f} us'
+    if baseline is not None:
+        line += f'  {seconds / baseline:>6.2f}x'
+    print(line)
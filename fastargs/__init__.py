@@ -5,12 +5,35 @@ fastargs
 library for configuration/parameters management
 
 """
+from importlib import import_module
+
 from .section import Section
 from .param import Param
-from .config import Config
-from .state import get_current_config, set_current_config
-
-from . import validation
-from . import decorators
+from .state import get_current_config, set_current_config, use_config
 
 __version__ = "1.1.1"
+
+__all__ = ['Section', 'Param', 'Config', 'get_current_config',
+           'set_current_config', 'use_config', 'validation', 'decorators']
+
+# Loaded on first access (PEP 562) so that processes that only read a
+# config do not pay for what they don't use. validation is always loaded,
+# by Param
+LAZY_ATTRIBUTES = {
+    'Config': ('.config', 'Config'),
+    'decorators': ('.decorators', None),
+}
+
+def __getattr__(name):
+    try:
+        module_name, attribute = LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module_name, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(LAZY_ATTRIBUTES))
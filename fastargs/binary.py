@@ -0,0 +1,240 @@
+import mmap
+import pickle
+import struct
+from collections.abc import Mapping, MutableMapping
+
+from .compiled import CompiledConfig, encode_value, decode_value
+from .dict_utils import PathTrie
+
+# File layout:
+#   header: magic, format version, number of entries
+#   index: one record per entry, sorted by key:
+#          (key offset, key size, value offset, value size,
+#           param offset, param size, content offset, content size)
+#   blobs: dotted keys (utf-8), pickled values, pickled params and pickled
+#          raw contents
+# A value size of 0 means that the value could not be resolved, the raw
+# content is only stored for those (with a size of 0 when there was none).
+MAGIC = b'FARGSBIN'
+VERSION = 2
+HEADER = struct.Struct('<8sIQ')
+RECORD = struct.Struct('<8Q')
+# Start of a record: offset and size of the key
+KEY = struct.Struct('<2Q')
+
+# Processes reading a handful of values only binary search the keys, the
+# ones reading more decode all the keys once
+SEARCHES_BEFORE_INDEX = 64
+
+
+def dump(config, fname):
+    compiled = CompiledConfig.from_config(config)
+    records = []
+    for path, param in compiled.entries.items():
+        value = content = b''
+        if path in compiled.values:
+            value = pickle.dumps(encode_value(compiled.values[path]))
+        elif compiled.content.get(path) is not None:
+            # Invalid value, kept so that loading it fails the same way
+            content = pickle.dumps(encode_value(compiled.content[path]))
+        records.append(('.'.join(path).encode('utf-8'), value,
+                        pickle.dumps(param), content))
+    records.sort(key=lambda record: record[0])
+
+    offset = HEADER.size + RECORD.size * len(records)
+    index = []
+    blobs = []
+    for record in records:
+        fields = []
+        for blob in record:
+            fields.extend((offset, len(blob)))
+            blobs.append(blob)
+            offset += len(blob)
+        index.append(RECORD.pack(*fields))
+
+    with open(fname, 'wb') as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, len(records)))
+        handle.writelines(index)
+        handle.writelines(blobs)
+
+
+class Snapshot:
+    def __init__(self, fname):
+        with open(fname, 'rb') as handle:
+            self.buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.buffer)
+        magic, version, self.count = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{fname} is not a fastargs binary config')
+        # Result of find per path, each path is only searched once
+        self.found = {}
+        # Index of every key, built once enough paths were searched for it to
+        # pay off
+        self.positions = None
+
+    def record(self, i):
+        return RECORD.unpack_from(self.buffer, HEADER.size + i * RECORD.size)
+
+    def key(self, i):
+        offset, size = KEY.unpack_from(self.buffer, HEADER.size + i * RECORD.size)
+        return self.buffer[offset:offset + size]
+
+    def find(self, path):
+        try:
+            return self.found[path]
+        except KeyError:
+            pass
+        key = '.'.join(path).encode('utf-8')
+        if self.positions is None and len(self.found) >= SEARCHES_BEFORE_INDEX:
+            self.positions = {self.key(i): i for i in range(self.count)}
+        if self.positions is not None:
+            i = self.positions.get(key)
+            record = None if i is None else self.record(i)
+        else:
+            record = self.search(key)
+        self.found[path] = record
+        return record
+
+    def search(self, key):
+        # Binary search on the sorted keys, only touches log(n) pages
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self.key(low) == key:
+            return self.record(low)
+        return None
+
+    def paths(self):
+        for i in range(self.count):
+            yield tuple(self.key(i).decode('utf-8').split('.'))
+
+    def load(self, offset, size):
+        return pickle.loads(self.view[offset:offset + size])
+
+
+class MappedValues(Mapping):
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def __getitem__(self, path):
+        record = self.snapshot.find(path)
+        if record is None or record[3] == 0:
+            raise KeyError(path)
+        return decode_value(self.snapshot.load(record[2], record[3]))
+
+    def __contains__(self, path):
+        record = self.snapshot.find(path)
+        return record is not None and record[3] != 0
+
+    def __iter__(self):
+        return (path for path in self.snapshot.paths() if path in self)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class MappedContent(Mapping):
+    # Raw content of the values that could not be resolved when dumped
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def __getitem__(self, path):
+        record = self.snapshot.find(path)
+        if record is None or record[7] == 0:
+            raise KeyError(path)
+        return decode_value(self.snapshot.load(record[6], record[7]))
+
+    def __contains__(self, path):
+        record = self.snapshot.find(path)
+        return record is not None and record[7] != 0
+
+    def __iter__(self):
+        return (path for path in self.snapshot.paths() if path in self)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class MappedEntries(MutableMapping):
+    # Params are unpickled on first use, entries declared after loading
+    # (eg. by the worker importing the code) are kept on the side
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.loaded = {}
+
+    def __getitem__(self, path):
+        try:
+            return self.loaded[path]
+        except KeyError:
+            pass
+        record = self.snapshot.find(path)
+        if record is None:
+            raise KeyError(path)
+        param = self.snapshot.load(record[4], record[5])
+        self.loaded[path] = param
+        return param
+
+    def __setitem__(self, path, param):
+        self.loaded[path] = param
+
+    def __delitem__(self, path):
+        raise TypeError('Entries of a binary config can not be removed')
+
+    def __iter__(self):
+        yield from self.snapshot.paths()
+        for path in self.loaded:
+            if self.snapshot.find(path) is None:
+                yield path
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class BinaryConfig(CompiledConfig):
+    def __init__(self, fname):
+        snapshot = Snapshot(fname)
+        super().__init__(MappedValues(snapshot), {})
+        self.entries = MappedEntries(snapshot)
+        self.stored = MappedContent(snapshot)
+        self.fname = fname
+
+    def resolve(self, path):
+        # Resolved values don't need their param to be unpickled, unless it
+        # was declared again since (its section might be disabled)
+        if path not in self.content and path not in self.entries.loaded:
+            try:
+                return self.values[path]
+            except KeyError:
+                pass
+        return super().resolve(path)
+
+    def resolve_value(self, path, param):
+        # Values that were invalid when dumped are checked again, unless
+        # a new value was collected since
+        if path not in self.content and path in self.stored:
+            return param.validate(self.stored[path])
+        return super().resolve_value(path, param)
+
+    @property
+    def index(self):
+        # Built on the first prefix query so that loading a snapshot does
+        # not have to decode every key
+        if self._index is None:
+            self._index = PathTrie()
+            for path in self.entries:
+                self._index.insert(path)
+        return self._index
+
+    @index.setter
+    def index(self, index):
+        self._index = None
+
+    def __reduce__(self):
+        if self.content:
+            return super().__reduce__()
+        # Other processes can map the same file
+        return BinaryConfig, (self.fname,)
@@ -0,0 +1,81 @@
+import argparse
+
+from terminaltables import SingleTable
+
+EPILOG_START = """
+Arguments:
+----------
+
+Each argument can be defined from a JSON file, a YAML file, env variable
+or from CLI arguments. For CLI just use:
+
+--PATH.TO.ARG=value
+
+"""
+
+
+class HelpFormatter(argparse.RawTextHelpFormatter):
+    # The tables are only rendered when the help is actually formatted, and
+    # appended after the epilog of the parser
+    def __init__(self, prog, tables=None, **kwargs):
+        super().__init__(prog, **kwargs)
+        self.tables = tables
+
+    def format_help(self):
+        text = super().format_help()
+        if self.tables is not None:
+            text += self.tables.render()
+        return text
+
+
+class HelpTables:
+    def __init__(self, config):
+        self.config = config
+        self.rendered = None
+
+    def render(self):
+        version = self.config.version
+        if self.rendered is None or self.rendered[0] != version:
+            self.rendered = (version, EPILOG_START + render_tables(self.config))
+        return self.rendered[1]
+
+
+def register_arguments(config, parser, registered):
+    added = 0
+    for path, param in list(config.entries.items()):
+        if path in registered or not config.section_enabled(param.section):
+            continue
+        argname = '.'.join(path)
+        # We do not want to show the args since we have our nice table after
+        if argname == 'help' or argname == 'h':
+            raise ValueError(f"Argument {argname} is reserved for argparse help")
+        registered.add(path)
+        added += 1
+        try:
+            additional_args = {}
+            if param.is_flag:
+                additional_args['action'] = 'store_true'
+            parser.add_argument(f'--{argname}',
+                                help=argparse.SUPPRESS,
+                                **additional_args)
+        except argparse.ArgumentError:
+            pass  # It might have been added to the parser by someone else
+    return added
+
+
+def render_tables(config):
+    epilog = ""
+    for sec_path, entries in config.sections_to_entries.items():
+        table_content = [['Name', 'Default', 'Constraint', 'Description']]
+        for path in entries:
+            param = config.entries[path]
+            if not config.section_enabled(param.section):
+                continue
+            default = param.default
+            if param.required:
+                default = 'Requried!'
+            table_content.append(['.'.join(path), default,
+                                  param.checker.help(), param.desc])
+        section_desc = config.sections[sec_path].desc
+        epilog += SingleTable(table_content, section_desc).table + "\n\n"
+    return epilog
@@ -0,0 +1,84 @@
+import importlib
+from types import ModuleType
+
+from .config import Config
+from .exceptions import MissingValueError, ValidationError
+from .param import Param
+
+
+class ModuleReference:
+    # Modules can't be pickled, we send their name and import them back
+    def __init__(self, name):
+        self.name = name
+
+
+def encode_value(value):
+    if isinstance(value, ModuleType):
+        return ModuleReference(value.__name__)
+    return value
+
+def decode_value(value):
+    if isinstance(value, ModuleReference):
+        return importlib.import_module(value.name)
+    return value
+
+def schema_param(param):
+    # Sections (and their conditions) stay behind, the enabled state is
+    # already accounted for in the resolved values
+    return Param(param.checker, param.desc, default=param.default,
+                 required=param.required, is_flag=param.is_flag)
+
+def restore(values, entries, sections_to_entries, content):
+    values = {path: decode_value(value) for path, value in values.items()}
+    return CompiledConfig(values, entries, sections_to_entries, content)
+
+
+class CompiledConfig(Config):
+    # Config holding already resolved and validated values. It is cheap to
+    # pickle and can be installed in worker processes with
+    # set_current_config without collecting any source again.
+
+    def __init__(self, values, entries, sections_to_entries=None,
+                 content=None):
+        super().__init__()
+        self.values = values
+        self.entries.update(entries)
+        for path in entries:
+            self.index.insert(path)
+        if sections_to_entries is not None:
+            self.sections_to_entries.update(sections_to_entries)
+        if content is not None:
+            self.content.update(content)
+
+    @classmethod
+    def from_config(cls, config):
+        values = {}
+        entries = {}
+        content = {}
+        for path, param in config.entries.items():
+            entries[path] = schema_param(param)
+            try:
+                values[path] = config.lookup(path)
+            except (MissingValueError, ValidationError):
+                # Keep the raw value so that the error shows up on access
+                if path in config.content:
+                    content[path] = config.content[path]
+        sections_to_entries = {ns: list(paths) for ns, paths
+                               in config.sections_to_entries.items()}
+        return cls(values, entries, sections_to_entries, content)
+
+    def resolve_value(self, path, param):
+        # Values collected after the compilation take precedence
+        if path not in self.content:
+            try:
+                return self.values[path]
+            except KeyError:
+                pass
+        return super().resolve_value(path, param)
+
+    def __reduce__(self):
+        compiled = CompiledConfig.from_config(self)
+        values = {path: encode_value(value)
+                  for path, value in compiled.values.items()}
+        return restore, (values, compiled.entries,
+                         dict(compiled.sections_to_entries), compiled.content)
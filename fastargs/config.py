@@ -1,17 +1,27 @@
-import argparse
-from collections import defaultdict
-import json
+from collections import defaultdict, deque
 import sys
 import os
+from threading import RLock
+from functools import partial
 
-from terminaltables import SingleTable
-
-from .param import Param
+from .param import Param, PendingCheck, DeferredParam, COMPILE_AFTER
 from .section import Section
-from .exceptions import MissingValueError, ValidationError
+from .exceptions import (
+    MissingValueError, ValidationError, CyclicConditionError)
+from .frozen import FrozenConfig
+from .state import use_config
 from .dict_utils import (
     fix_dict, expand_keys, recursive_get, rec_dd, recursive_set,
-    NestedNamespace)
+    NestedNamespace, PathTrie, to_path)
+from .view import ConfigView
+
+
+def env_variable_name(path, prefix=None):
+    # Without prefix the variable is named after the path: a.b.c
+    # With prefix they are mangled to be valid shell names: PREFIX_A__B__C
+    if prefix is None:
+        return '.'.join(path)
+    return prefix + '__'.join(path).upper()
 
 
 class Config:
@@ -19,129 +29,189 @@ class Config:
         self.sections = defaultdict(lambda: None)
         self.sections_to_entries = defaultdict(list)
         self.entries = {}
+        # Prefix indexes over the entry paths and the section namespaces
+        self.index = PathTrie()
+        self.section_index = PathTrie()
+        # Queues of the collect calls in progress (they can be nested when a
+        # validated value imports code that collects itself)
+        self.collecting = []
         self.content = {}
+        # (file name, parsing backend) of the config files collected
+        self.loaded_files = []
+        # Validated values, keyed by the path as it was requested
+        self.cache = {}
+        # Bumped every time resolved values might have changed
+        self.version = 0
+        # Result of the section conditions and, for each path, the sections
+        # whose condition read it
+        self.enabled = {}
+        self.dependents = defaultdict(set)
+        # Sections whose condition is running and the paths read by the
+        # innermost one
+        self.evaluating = []
+        self.recording = None
+        # Conditions are evaluated by one thread at a time
+        self.condition_lock = RLock()
+        # Child configs reading their values from this one (WeakSet)
+        self.overlays = None
+        # Created by the first call to fingerprint()
+        self.fingerprints = None
+        # Set while a profiling.Profiler is attached
+        self.profiler = None
+
+    def add_overlay(self, overlay):
+        if self.overlays is None:
+            from weakref import WeakSet
+            self.overlays = WeakSet()
+        self.overlays.add(overlay)
+
+    def invalidate(self, paths=None):
+        if paths is not None:
+            paths = list(paths)
+        if self.overlays:
+            for overlay in list(self.overlays):
+                overlay.invalidate(paths)
+
+        self.version += 1
+        if paths is None:
+            self.cache.clear()
+            self.enabled.clear()
+            self.dependents.clear()
+            if self.fingerprints is not None:
+                self.fingerprints.invalidate()
+            return
+
+        # Only forget the values of the changed paths and of the sections
+        # whose condition (transitively) depends on them
+        changed = deque(paths)
+        seen = set()
+        while changed:
+            path = changed.popleft()
+            if path in seen:
+                continue
+            seen.add(path)
+            self.cache.pop(path, None)
+            self.cache.pop('.'.join(path), None)
+            for section in self.dependents.pop(path, ()):
+                if section in self.enabled:
+                    del self.enabled[section]
+                    changed.extend(self.sections_to_entries.get(section.ns, ()))
+        if self.fingerprints is not None:
+            self.fingerprints.invalidate(seen)
 
     def add_section(self, section):
         self.sections[section.ns] = section
+        self.section_index.insert(section.ns, section)
+        self.invalidate()
 
     def add_entry(self, ns, name, param):
         path = ns + tuple(name.split('.'))
         self.sections_to_entries[ns].append(path)
         self.entries[path] = param
+        self.index.insert(path)
+        for pending in self.collecting:
+            pending.append(path)
+        self.invalidate()
 
     def collect(self, config):
-        config = fix_dict(expand_keys(config))
-        entries = list(self.entries.items())
-        # We repeat until the list of entries doesn't change
-        while True:
-            for path, param in entries:
-                try:
-                    value = recursive_get(config, path)
-                    if value is not None:
-                        self.content[path] = value
-                        # We try to validate the parameter to trigger an
-                        # import in the case the param contains a module
-                        try:
-                            param.validate(value)
-                        except:
-                            pass
-                except:
-                    pass
-            new_entries = list(self.entries.items())
-            if len(new_entries) == len(entries):
-                break
-            else:
-                entries = new_entries
+        config = expand_keys(config)
+        # Validating a value might import code that declares new entries,
+        # add_entry queues them so that each entry is only looked at once
+        pending = deque(self.entries.keys())
+        self.collecting.append(pending)
+        changed = []
+        try:
+            self.collect_pending(config, pending, changed)
+        finally:
+            self.collecting[:] = [q for q in self.collecting if q is not pending]
+        self.invalidate(changed)
         return self
 
+    def collect_pending(self, config, pending, changed):
+        while pending:
+            path = pending.popleft()
+            param = self.entries[path]
+            try:
+                value = recursive_get(config, path)
+                if value is not None:
+                    self.content[path] = value
+                    changed.append(path)
+                    # We try to validate the parameter to trigger an
+                    # import in the case the param contains a module
+                    try:
+                        param.validate(value)
+                    except:
+                        pass
+            except:
+                pass
+
     def augment_argparse(self, parser):
+        from .cli import HelpFormatter, HelpTables, register_arguments
+
         parser.add_argument('--config-file', '-C', action='append', default=[],
                             help='Integrate a config file (json or yaml, can be repeated)')
 
-        parser.formatter_class = argparse.RawTextHelpFormatter
-
-        epilogStart = """
-Arguments:
-----------
+        parser.formatter_class = partial(HelpFormatter, tables=HelpTables(self))
 
-Each argument can be defined from a JSON file, a YAML file, env variable
-or from CLI arguments. For CLI just use:
-
---PATH.TO.ARG=value
-
-"""
-        previous_epilog = ""
+        # Collecting the arguments can enable sections or import modules
+        # declaring new entries, we repeat until no new argument shows up
+        registered = set()
+        collected = False
         while True:
-            epilog = ""
-            for sec_path, entries in self.sections_to_entries.items():
-                table_content = [['Name', 'Default', 'Constraint', 'Description']]
-                for path in entries:
-                    param = self.entries[path]
-                    if not param.section.is_enabled(self):
-                        continue
-                    argname = '.'.join(path)
-                    # We do not want to show the args since we have our nice table after
-                    if argname == 'help' or argname == 'h':
-                        raise ValueError(f"Argument {argname} is reserved for argparse help")
-                    try:
-                        additional_args = {}
-                        if param.is_flag:
-                            additional_args['action'] = 'store_true'
-                        parser.add_argument(f'--{argname}',
-                                            help=argparse.SUPPRESS,
-                                            **additional_args)
-                    except argparse.ArgumentError:
-                        pass  # We might have tried to add this one already
-                    default = param.default
-                    if param.required:
-                        default = 'Requried!'
-                    table_content.append([argname, default, param.checker.help(), param.desc])
-                section_desc = self.sections[sec_path].desc
-                epilog += SingleTable(table_content, section_desc).table + "\n\n"
-
-            entry_count = len(self.entries)
-            self.collect_argparse_args(parser, disable_help=True)
-            # If we have more entries in the config we have to regenerate
-            # the help with the new settings
-            if len(self.entries) == entry_count and epilog == previous_epilog:
+            added = register_arguments(self, parser, registered)
+            if collected and not added:
                 break
-            previous_epilog = epilog
-
-
-        parser.epilog = epilogStart + epilog
+            self.collect_argparse_args(parser, disable_help=True)
+            collected = True
 
         return self
 
-
-    def collect_config_file(self, fname):
-        try:
-            self.collect_json(fname)
-        except json.decoder.JSONDecodeError:
-            self.collect_yaml(fname)
+    def collect_config_file(self, fname, cache=None):
+        from .loaders import load_config_file
+        content, backend = load_config_file(fname, cache)
+        self.loaded_files.append((fname, backend))
+        self.collect(content)
 
         return self
 
-
     def collect_json(self, fname):
-        with open(fname) as handle:
-            self.collect(json.load(handle))
+        self.collect_file(fname, '.json')
 
         return self
 
     def collect_yaml(self, fname):
-        import yaml
-        with open(fname) as handle:
-            content = handle.read()
-        self.collect(yaml.safe_load(content))
+        self.collect_file(fname, '.yaml')
 
         return self
 
-    def collect_env_variables(self):
-        self.collect(dict(os.environ))
+    def collect_file(self, fname, extension):
+        from .loaders import get_loader
+        loader = get_loader(extension)
+        with open(fname) as handle:
+            content = handle.read()
+        self.loaded_files.append((fname, loader.name))
+        self.collect(loader(content))
+
+    def collect_env_variables(self, prefix=None):
+        # We only look up the variables of the declared entries, entries
+        # declared by imports triggered along the way are looked up next
+        looked_up = set()
+        while True:
+            found = {}
+            for path in list(self.entries.keys()):
+                if path in looked_up:
+                    continue
+                looked_up.add(path)
+                value = os.environ.get(env_variable_name(path, prefix))
+                if value is not None:
+                    found[path] = value
+            if not found:
+                break
+            self.collect(found)
 
         return self
 
-    def collect_argparse_args(self, parser, disable_help=False):
+    def collect_argparse_args(self, parser, disable_help=False, env_prefix=None):
         cli_args = sys.argv[1:]
         if disable_help:
             cli_args = [x for x in cli_args if x != '--help']
@@ -153,22 +223,58 @@ or from CLI arguments. For CLI just use:
         del args['config_file']
 
         self.collect(args)
-        self.collect_env_variables()
+        self.collect_env_variables(env_prefix)
 
         return self
 
     def __getitem__(self, path):
+        if self.recording is not None:
+            self.recording.add(path)
+        try:
+            return self.cache[path]
+        except KeyError:
+            pass
+
+        try:
+            return self.lookup(path)
+        except ValidationError as e:
+            dotted = path if isinstance(path, str) else '.'.join(path)
+            print(f'Issue when typechecking argument psyh `{dotted}`:')
+            raise e
+
+    def lookup(self, path):
+        # Same as config[path] but silent on validation errors, for the
+        # code reading every value (compile, dump_binary...)
+        try:
+            return self.cache[path]
+        except KeyError:
+            pass
+
+        key = path
         if isinstance(path, str):
             path = tuple(path.split('.'))
 
+        # A value collected while resolving this one must not be hidden by
+        # the old value ending up in the cache
+        version = self.version
+        value = self.resolve(path)
+        if self.version == version:
+            self.cache[key] = value
+            self.cache[path] = value
+        return value
+
+    def resolve(self, path):
         try:
             param = self.entries[path]
         except KeyError:
             raise KeyError(f"{'.'.join(path)} not defined")
 
-        if not param.section.is_enabled(self):
+        if param.section is not None and not self.section_enabled(param.section):
             return None
 
+        return self.resolve_value(path, param)
+
+    def resolve_value(self, path, param):
         try:
             value = self.content[path]
         except KeyError:
@@ -180,12 +286,63 @@ or from CLI arguments. For CLI just use:
         if value is None and not param.required:
             return value
 
+        return param.validate(value)
+
+    def paths(self, prefix=()):
+        return self.index.paths(to_path(prefix))
+
+    def section_of(self, path):
+        # Section the param was declared in, for other paths the deepest
+        # section whose namespace contains them
+        path = to_path(path)
+        param = self.entries.get(path)
+        if param is not None:
+            return param.section
+        return self.section_index.longest_prefix(path)
+
+    def is_enabled(self, path):
+        section = self.section_of(path)
+        return section is None or self.section_enabled(section)
+
+    def section_enabled(self, section):
+        if section.condition is None:
+            return True
         try:
-            return param.validate(value)
-        except ValidationError as e:
-            print(f'Issue when typechecking argument psyh `{".".join(path)}`:')
-            raise e
+            return self.enabled[section]
+        except KeyError:
+            pass
+
+        with self.condition_lock:
+            try:
+                return self.enabled[section]
+            except KeyError:
+                pass
 
+            if section in self.evaluating:
+                cycle = self.evaluating[self.evaluating.index(section):]
+                names = ' -> '.join('.'.join(s.ns) for s in cycle + [section])
+                raise CyclicConditionError(f'Section conditions depend on each other: {names}')
+
+            # Record the paths read by the condition to only evaluate it
+            # again once one of them changes
+            outer = self.recording
+            self.recording = read = set()
+            self.evaluating.append(section)
+            try:
+                result = section.is_enabled(self)
+            finally:
+                self.evaluating.pop()
+                self.recording = outer
+
+            for path in read:
+                if isinstance(path, str):
+                    path = tuple(path.split('.'))
+                self.dependents[path].add(section)
+            self.enabled[section] = result
+            return result
+
+    def view(self, prefix):
+        return ConfigView(self, to_path(prefix))
 
     def get(self):
         result = rec_dd()
@@ -196,13 +353,63 @@ or from CLI arguments. For CLI just use:
 
         return NestedNamespace(fix_dict(result))
 
-    def validate(self, mode='stderr'):
-        errors = {}
-        for path, param in self.entries.items():
-            try:
-                self[path]
-            except (MissingValueError, ValidationError) as e:
-                errors[path] = e
+    def freeze(self):
+        values = {}
+        for path in self.entries.keys():
+            value = self[path]
+            if value is not None:
+                values[path] = value
+
+        return FrozenConfig(values)
+
+    def fingerprint(self, paths=None):
+        # Stable hash of the resolved values, of the whole config or only of
+        # the subtrees under the given prefix(es)
+        from .fingerprint import FingerprintIndex
+        if self.fingerprints is None:
+            self.fingerprints = FingerprintIndex()
+
+        if paths is None:
+            prefixes = [()]
+        elif isinstance(paths, (str, tuple)):
+            prefixes = [to_path(paths)]
+        else:
+            prefixes = sorted({to_path(path) for path in paths})
+        self.fingerprints.refresh(self, prefixes)
+        return self.fingerprints.digest(prefixes)
+
+    def overlay(self, overrides=None):
+        # Child config holding only the given values ({path: value}), the
+        # others are read from this config
+        from .overlay import OverlayConfig
+        return OverlayConfig(self, overrides or {})
+
+    def scoped(self):
+        # with config.scoped(): makes it the current config of this thread /
+        # asyncio task only
+        return use_config(self)
+
+    def profile(self, sinks=()):
+        # with config.profile([callback]) as profiler: ...
+        from .profiling import profile
+        return profile(self, sinks)
+
+    def compile(self):
+        from .compiled import CompiledConfig
+        return CompiledConfig.from_config(self)
+
+    def dump_binary(self, fname):
+        from .binary import dump
+        dump(self, fname)
+        return self
+
+    @staticmethod
+    def load_binary(fname):
+        from .binary import BinaryConfig
+        return BinaryConfig(fname)
+
+    def validate(self, mode='stderr', parallel=None):
+        errors = self.validate_all(parallel)
 
         if mode == 'stderr':
             if len(errors) > 0:
@@ -217,6 +424,7 @@ or from CLI arguments. For CLI just use:
                         got = self.content[path]
                     table.append(['.'.join(path), issue, got])
 
+                from terminaltables import SingleTable
                 print(SingleTable(table, 'Argument validation errors').table,
                       file=sys.stderr)
                 sys.exit()
@@ -224,6 +432,65 @@ or from CLI arguments. For CLI just use:
         elif mode == 'errordict':
             return errors
 
+    def validate_all(self, parallel=None):
+        # Params sharing a checker are validated together, values end up in
+        # the cache. With parallel=N they are spread over N threads (and N
+        # processes for the process safe checkers)
+        version = self.version
+        values = {}
+        groups = defaultdict(list)
+        for path, param in self.entries.items():
+            if path in self.cache:
+                continue
+            section = param.section
+            if section is not None and not self.section_enabled(section):
+                values[path] = None
+                continue
+            groups[id(param.checker)].append((path, param))
+
+        errors = {}
+        if parallel is not None and parallel > 1:
+            from .parallel import validate_parallel
+            items = [item for items in groups.values() for item in items]
+            found, errors = validate_parallel(self, items, parallel)
+            values.update(found)
+        else:
+            for items in groups.values():
+                self.validate_group(items, values, errors)
+
+        # Unless something was collected in the meantime
+        if self.version == version:
+            self.cache.update(values)
+
+        # Same order as the entries
+        return {path: errors[path] for path in self.entries if path in errors}
+
+    def validate_group(self, items, values, errors):
+        # Large groups are checked by a single compiled function, the
+        # values are looked up first and checked in one loop
+        if len(items) <= COMPILE_AFTER:
+            for path, param in items:
+                try:
+                    values[path] = self.resolve_value(path, param)
+                except (MissingValueError, ValidationError) as e:
+                    errors[path] = e
+            return
+
+        check = items[0][1].checker.compile()
+        for path, param in items:
+            try:
+                value = self.resolve_value(path, DeferredParam(param))
+            except (MissingValueError, ValidationError) as e:
+                errors[path] = e
+                continue
+            if isinstance(value, PendingCheck):
+                try:
+                    value = check(value.value)
+                except Exception:
+                    errors[path] = param.validation_error(value.value)
+                    continue
+            values[path] = value
+
     def summary(self, target=sys.stderr):
         table = [['Parameter', 'Value']]
 
@@ -235,6 +502,7 @@ or from CLI arguments. For CLI just use:
             except:
                 pass
 
+        from terminaltables import SingleTable
         print(SingleTable(table, ' Arguments defined').table, file=target)
 
         return self
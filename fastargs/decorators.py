@@ -1,3 +1,6 @@
+from functools import partial, update_wrapper
+from types import MethodType
+
 from .state import get_current_config
 
 class WrappedFunction:
@@ -5,9 +8,14 @@ class WrappedFunction:
     def __init__(self, func):
         self.func = func
         self.arg_paths = []
+        # (config, config version, resolved arguments, failed arguments) of
+        # the last call
+        self.bound = None
+        update_wrapper(self, func)
 
     def add_arg(self, arg, alias):
         self.arg_paths.append([None, arg, alias])
+        self.bound = None
 
     def set_section(self, section):
         for i in reversed(range(len(self.arg_paths))):
@@ -16,22 +24,73 @@ class WrappedFunction:
                 self.arg_paths[i][0] = section
             else:
                 break
-
-    def __call__(self, *args, **kwargs):
-        config = get_current_config()
+        self.bound = None
+
+    def resolve(self, config, overridden=(), failed=None):
+        profiler = getattr(config, 'profiler', None)
+        if profiler is not None:
+            name = f'{self.func.__module__}.{self.func.__qualname__}'
+            with profiler.timed(profiler.functions, name):
+                return self.resolve_args(config, overridden, failed)
+        return self.resolve_args(config, overridden, failed)
+
+    def resolve_args(self, config, overridden=(), failed=None):
+        # With failed, the arguments that can't be read from the config are
+        # listed there as (alias, error) instead of raising
         filled_args = {}
         for ns, path, alias in self.arg_paths:
             if ns is not None:
                 path = ns + path
-            if alias in kwargs:  # User overrode this argument
+            if alias in overridden:  # User overrode this argument
                 continue
 
-            value = config[path]
+            if failed is None:
+                value = config[path]
+            else:
+                try:
+                    value = config[path]
+                except Exception as e:
+                    failed.append((alias, e))
+                    continue
 
             if value is not None:
                 filled_args[alias] = value
 
-        filled_args.update(kwargs)
+        return filled_args
+
+    def bind(self, config=None):
+        # Freeze the current values of the arguments, the result does not
+        # follow later changes of the config
+        if config is None:
+            config = get_current_config()
+        return partial(self.func, **self.resolve(config))
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __call__(self, *args, **kwargs):
+        config = get_current_config()
+        # Configs without a version (eg. frozen or duck typed) are read on
+        # every call
+        version = getattr(config, 'version', None)
+        bound = self.bound
+        if (bound is None or version is None or bound[0] is not config
+                or bound[1] != version):
+            failed = []
+            bound = (config, version, self.resolve(config, failed=failed), failed)
+            if version is not None:
+                self.bound = bound
+
+        filled_args = bound[2]
+        # The arguments that can't be read from the config have to be
+        # provided by the caller
+        for alias, error in bound[3]:
+            if alias not in kwargs:
+                raise error.with_traceback(None)
+        if kwargs:
+            filled_args = {**filled_args, **kwargs}
 
         try:
             return self.func(*args, **filled_args)
@@ -43,8 +102,8 @@ named parameter to resolve it""") from None
                 raise e
 
 def extract_function(func):
-    if hasattr(func, '__fastarg_wrapper'):
-        return getattr(func, '__fastarg_wrapper')
+    if isinstance(func, WrappedFunction):
+        return func
     else:
         return WrappedFunction(func)
 
@@ -56,16 +115,9 @@ def param(parameter, alias=None):
         alias = parameter[-1]
 
     def wrapper(func):
-
         func = extract_function(func)
-
         func.add_arg(parameter, alias)
-
-        def result(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        setattr(result, '__fastarg_wrapper', func)
-        return result
+        return func
 
     return wrapper
 
@@ -12,37 +12,60 @@ class NestedNamespace(SimpleNamespace):
             else:
                 self.__setattr__(key, value)
 
+def to_path(path):
+    if isinstance(path, str):
+        return tuple(path.split('.')) if path else ()
+    return tuple(path)
+
 def rec_dd():
     return defaultdict(rec_dd)
 
 def recursive_get(dic, path):
-    if len(path) == 0:
-        return dic
-    head = path[0]
-    tail = path[1:]
-    return recursive_get(dic[head], tail)
+    for key in path:
+        dic = dic[key]
+    return dic
 
 def recursive_set(dic, path, value):
-    if len(path) == 1:
-        dic[path[0]] = value
-    else:
-        head = path[0]
-        tail = path[1:]
-
-        recursive_set(dic[head], tail, value)
-
-
-def expand_keys(dic, prefix=tuple(), result=None):
-    if result is None:
-        result = rec_dd()
-
-    if not isinstance(dic, dict):
-        recursive_set(result, prefix, dic)
-    else:
-        for k, v in dic.items():
-            path = tuple(k.split('.'))
-            full_path = prefix + path
-            expand_keys(v, full_path, result)
+    last = len(path) - 1
+    for i in range(last):
+        dic = dic[path[i]]
+    dic[path[last]] = value
+
+
+def iter_leaves(dic):
+    # Depth first, in insertion order, so later keys override earlier ones
+    # exactly like they would with nested dicts
+    stack = [((), iter(dic.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            if isinstance(k, tuple):
+                path = prefix + k
+            elif '.' in k:
+                path = prefix + tuple(k.split('.'))
+            else:
+                path = prefix + (k,)
+            if isinstance(v, dict):
+                stack.append((path, iter(v.items())))
+                break
+            yield path, v
+        else:
+            stack.pop()
+
+def flatten_keys(dic):
+    return dict(iter_leaves(dic))
+
+def expand_keys(dic):
+    result = {}
+    for path, value in iter_leaves(dic):
+        node = result
+        last = len(path) - 1
+        for i in range(last):
+            child = node.get(path[i])
+            if not isinstance(child, dict):
+                child = node[path[i]] = {}
+            node = child
+        node[path[last]] = value
     return result
 
 def fix_dict(defdict):
@@ -51,3 +74,63 @@ def fix_dict(defdict):
             defdict[k] = fix_dict(defdict[k])
         return dict(defdict)
     return defdict
+
+
+class PathTrie:
+    # Prefix tree over paths: lookups cost O(depth) and subtrees can be
+    # walked without looking at the rest of the paths
+
+    def __init__(self):
+        self.children = {}
+        self.has_value = False
+        self.value = None
+
+    def insert(self, path, value=True):
+        node = self
+        for key in path:
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = PathTrie()
+            node = child
+        node.has_value = True
+        node.value = value
+
+    def find(self, path):
+        node = self
+        for key in path:
+            node = node.children.get(key)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, path):
+        node = self.find(path)
+        return node is not None and node.has_value
+
+    def longest_prefix(self, path):
+        # Value of the deepest node along the path holding one
+        node = self
+        result = self.value
+        for key in path:
+            node = node.children.get(key)
+            if node is None:
+                break
+            if node.has_value:
+                result = node.value
+        return result
+
+    def items(self, prefix=()):
+        node = self.find(prefix)
+        if node is None:
+            return
+        stack = [(tuple(prefix), node)]
+        while stack:
+            path, node = stack.pop()
+            if node.has_value:
+                yield path, node.value
+            for key, child in reversed(node.children.items()):
+                stack.append((path + (key,), child))
+
+    def paths(self, prefix=()):
+        for path, _ in self.items(prefix):
+            yield path
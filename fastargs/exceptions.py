@@ -3,3 +3,6 @@ class MissingValueError(ValueError):
 
 class ValidationError(ValueError):
     pass
+
+class CyclicConditionError(ValueError):
+    pass
@@ -0,0 +1,132 @@
+import hashlib
+import sys
+from types import ModuleType
+
+from .validation import is_array, LazyObject, import_module
+
+# Leaf digests are summed modulo 2**256: the hash of a subtree can be updated
+# by removing the old digest of a leaf and adding the new one
+MODULUS = 1 << 256
+
+
+def encode(value, out):
+    # Deterministic, type tagged and length prefixed: equal values give the
+    # same bytes in every process, different types never collide
+    if value is None:
+        out.append(b'N')
+    elif value is True or value is False:
+        out.append(b'B1' if value else b'B0')
+    elif isinstance(value, int):
+        out.append(b'I%d;' % value)
+    elif isinstance(value, float):
+        out.append(b'F' + repr(value).encode() + b';')
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        out.append(b'S%d:' % len(data))
+        out.append(data)
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(b'Y%d:' % len(value))
+        out.append(bytes(value))
+    elif isinstance(value, (list, tuple)):
+        out.append(b'%s%d:' % (b'L' if isinstance(value, list) else b'T',
+                               len(value)))
+        for item in value:
+            encode(item, out)
+    elif isinstance(value, dict):
+        items = sorted(encoded(k) + encoded(v) for k, v in value.items())
+        out.append(b'D%d:' % len(items))
+        out.extend(items)
+    elif isinstance(value, (set, frozenset)):
+        items = sorted(encoded(item) for item in value)
+        out.append(b'E%d:' % len(items))
+        out.extend(items)
+    elif is_array(value) or is_numpy_scalar(value):
+        data = value.tobytes()
+        out.append(b'A' + value.dtype.str.encode() + b'%r:%d:' % (value.shape, len(data)))
+        out.append(data)
+    elif isinstance(value, LazyObject):
+        # Encoded by name like the value it stands for, without importing it
+        tag = b'M' if value.load is import_module else b'O'
+        out.append(tag + value.name.encode() + b';')
+    elif isinstance(value, ModuleType):
+        out.append(b'M' + value.__name__.encode() + b';')
+    elif hasattr(value, '__module__') and hasattr(value, '__qualname__'):
+        # Functions and classes, eg. from ImportedObject
+        out.append(b'O' + f'{value.__module__}.{value.__qualname__}'.encode() + b';')
+    else:
+        raise TypeError(f"Can't fingerprint value of type {type(value).__name__}")
+
+def encoded(value):
+    out = []
+    encode(value, out)
+    return b''.join(out)
+
+def is_numpy_scalar(value):
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.generic)
+
+def leaf_digest(path, value):
+    data = encoded(path) + encoded(value)
+    return int.from_bytes(hashlib.sha256(data).digest(), 'big')
+
+
+class FingerprintIndex:
+    # Digest of every resolved value and, for every prefix, the sum of the
+    # digests under it. Changing a value updates O(depth) sums
+
+    def __init__(self):
+        self.leaves = {}
+        self.sums = {}
+        # Paths whose value might have changed, None when all might have
+        self.dirty = None
+
+    def invalidate(self, paths=None):
+        if paths is None:
+            self.dirty = None
+        elif self.dirty is not None:
+            self.dirty.update(paths)
+
+    def update(self, path, value):
+        digest = 0 if value is None else leaf_digest(path, value)
+        delta = digest - self.leaves.get(path, 0)
+        if delta == 0:
+            return
+        if digest:
+            self.leaves[path] = digest
+        else:
+            del self.leaves[path]
+        sums = self.sums
+        for i in range(len(path) + 1):
+            prefix = path[:i]
+            sums[prefix] = (sums.get(prefix, 0) + delta) % MODULUS
+
+    def refresh(self, config, prefixes):
+        # Only the values under the prefixes are read: values elsewhere may
+        # be missing or invalid without affecting these subtrees
+        while True:
+            if self.dirty is None:
+                self.dirty = set(config.entries)
+            todo = [path for prefix in prefixes
+                    for path in config.paths(prefix) if path in self.dirty]
+            if not todo:
+                return
+            for path in todo:
+                # Reading a value can invalidate the config again
+                if self.dirty is None:
+                    break
+                if path not in self.dirty:
+                    continue
+                self.dirty.discard(path)
+                try:
+                    value = config[path]
+                except Exception:
+                    self.invalidate([path])
+                    raise
+                self.update(path, value)
+
+    def digest(self, prefixes):
+        h = hashlib.sha256()
+        for prefix in prefixes:
+            h.update(encoded(prefix))
+            h.update(self.sums.get(prefix, 0).to_bytes(32, 'big'))
+        return h.hexdigest()
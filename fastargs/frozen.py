@@ -0,0 +1,179 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .validation import is_array
+
+
+def hashable(value):
+    if is_array(value):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, Mapping):
+        return frozenset((k, hashable(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(hashable(x) for x in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(hashable(x) for x in value)
+    return value
+
+
+SCALARS = {bool, int, float, complex, str, bytes}
+
+
+def frozen_value(value):
+    # Values are copied into immutable containers: the snapshot must not
+    # change (nor its hash) when the values of the config are mutated
+    if type(value) in SCALARS:
+        return value
+    if is_array(value):
+        value = value.copy()
+        value.flags.writeable = False
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: frozen_value(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(frozen_value(x) for x in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(frozen_value(x) for x in value)
+    return value
+
+
+def restore(values, prefix):
+    from .compiled import decode_value
+    node = FrozenConfig({path: decode_value(value)
+                         for path, value in values.items()})
+    for name in prefix:
+        node = node._children[name]
+    return node
+
+
+class FrozenConfig:
+    # Immutable snapshot of the resolved values of a Config. Every node of
+    # the tree is built once, when the snapshot is created: children are
+    # plain instance attributes and values are looked up in a table of the
+    # values under the node, by tuple and by dotted path.
+    __slots__ = ('_values', '_table', '_prefix', '_children', '_hash',
+                 '__dict__')
+
+    def __init__(self, values):
+        values = {path: frozen_value(value) for path, value in values.items()}
+        self._init_node(values, ())
+        table = {}
+
+        for path, value in values.items():
+            table[path] = table['.'.join(path)] = value
+            node = self
+            for i in range(len(path) - 1):
+                child = node._children.get(path[i])
+                if child is None:
+                    child = object.__new__(FrozenConfig)
+                    child._init_node(values, path[:i + 1])
+                    node._add_child(path[i], child)
+                node = child
+            node._add_child(path[-1], value)
+        object.__setattr__(self, '_table', table)
+
+    def _init_node(self, values, prefix):
+        set_slot = object.__setattr__
+        set_slot(self, '_values', values)
+        # Tables of the subtrees are only built when they are indexed
+        set_slot(self, '_table', None)
+        set_slot(self, '_prefix', prefix)
+        set_slot(self, '_children', {})
+        set_slot(self, '_hash', None)
+
+    def _add_child(self, name, child):
+        self._children[name] = child
+        self.__dict__[name] = child
+
+    def _build_table(self):
+        table = {}
+        for path, value in FrozenConfig._items(self):
+            table[path] = table['.'.join(path)] = value
+        object.__setattr__(self, '_table', table)
+        return table
+
+    def __getitem__(self, path):
+        table = self._table
+        if table is None:
+            table = FrozenConfig._build_table(self)
+        try:
+            return table[path]
+        except KeyError:
+            pass
+        except TypeError:  # eg. a list
+            path = tuple(path)
+            if path in table:
+                return table[path]
+
+        # Not a value, it might still be a subtree
+        if isinstance(path, str):
+            path = path.split('.')
+        node = self
+        try:
+            for name in path:
+                node = node._children[name]
+        except (KeyError, AttributeError):
+            raise KeyError(f"{'.'.join(self._prefix + tuple(path))} not defined") from None
+        return node
+
+    def __contains__(self, path):
+        try:
+            self[path]
+            return True
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        return iter(self._children)
+
+    def __dir__(self):
+        return list(self._children)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenConfig is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenConfig is immutable')
+
+    # Helpers are underscored (like namedtuple._asdict) so that they never
+    # hide a param with the same name. A param can hide them, the class is
+    # used to call them on children
+
+    def _items(self):
+        for name, child in self._children.items():
+            if isinstance(child, FrozenConfig):
+                for path, value in FrozenConfig._items(child):
+                    yield (name,) + path, value
+            else:
+                yield (name,), child
+
+    def _to_dict(self):
+        return {name: FrozenConfig._to_dict(child) if isinstance(child, FrozenConfig) else child
+                for name, child in self._children.items()}
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenConfig):
+            return NotImplemented
+        mine = dict(FrozenConfig._items(self))
+        theirs = dict(FrozenConfig._items(other))
+        try:
+            return mine == theirs
+        except ValueError:  # Comparing numpy arrays
+            return hashable(mine) == hashable(theirs)
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(hashable(dict(FrozenConfig._items(self)))))
+        return self._hash
+
+    def __reduce__(self):
+        # Modules are sent by name
+        from .compiled import encode_value
+        values = {path: encode_value(value)
+                  for path, value in self._values.items()}
+        return restore, (values, self._prefix)
+
+    def __repr__(self):
+        content = ', '.join(f"{'.'.join(path)}={value!r}"
+                            for path, value in FrozenConfig._items(self))
+        return f'FrozenConfig({content})'
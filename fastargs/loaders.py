@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+
+from .dict_utils import flatten_keys
+
+class Loader:
+    def __init__(self, name, parse):
+        self.backend = name
+        self.parse = parse
+
+    @property
+    def name(self):
+        # Recorded with the loaded files and in the cache key, subclasses
+        # can refine it (eg. with the implementation picked at runtime)
+        return self.backend
+
+    def __call__(self, text):
+        return self.parse(text)
+
+
+class YAMLLoader(Loader):
+    # Uses libyaml when PyYAML was built with it
+    def __init__(self):
+        super().__init__('yaml', parse_yaml)
+
+    @property
+    def name(self):
+        return f'yaml.{yaml_loader_class().__name__}'
+
+
+def yaml_loader_class():
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def parse_yaml(text):
+    import yaml
+    return yaml.load(text, Loader=yaml_loader_class())
+
+def parse_json(text):
+    return json.loads(text)
+
+YAML_LOADER = YAMLLoader()
+
+LOADERS = {
+    '.json': Loader('json', parse_json),
+    '.yaml': YAML_LOADER,
+    '.yml': YAML_LOADER,
+}
+
+def register_loader(extension, parse, name=None):
+    if not isinstance(parse, Loader):
+        parse = Loader(name or getattr(parse, '__qualname__', repr(parse)),
+                       parse)
+    LOADERS[extension.lower()] = parse
+
+def get_loader(extension):
+    return LOADERS[extension.lower()]
+
+def parse(fname, text):
+    # Returns the parsed content and the name of the backend used
+    extension = os.path.splitext(fname)[1].lower()
+    if extension in LOADERS:
+        loader = LOADERS[extension]
+        return loader(text), loader.name
+
+    if text.lstrip()[:1] in ('{', '['):
+        loader = LOADERS['.json']
+        try:
+            return loader(text), loader.name
+        except Exception:
+            pass  # YAML flow mappings also start with a brace
+
+    loader = LOADERS['.yaml']
+    return loader(text), loader.name
+
+
+def cache_dir():
+    if 'FASTARGS_CACHE_DIR' in os.environ:
+        return os.environ['FASTARGS_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME',
+                          os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'fastargs')
+
+def candidate_loaders(fname):
+    # Loaders parse() might use for this file
+    extension = os.path.splitext(fname)[1].lower()
+    if extension in LOADERS:
+        return [LOADERS[extension]]
+    return [LOADERS['.json'], LOADERS['.yaml']]
+
+def cache_path(fname):
+    # Parsing the file with another loader (eg. after register_loader) must
+    # not reuse the cached content
+    stat = os.stat(fname)
+    backends = ','.join(loader.name for loader in candidate_loaders(fname))
+    key = (f'{os.path.abspath(fname)}\0{stat.st_mtime_ns}\0{stat.st_size}'
+           f'\0{backends}')
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir(), digest + '.json')
+
+def read_cache(cached):
+    # The cache dir can be shared: files are plain JSON (never code) and
+    # only the ones written by this user are trusted
+    with open(cached) as handle:
+        if hasattr(os, 'getuid') and os.fstat(handle.fileno()).st_uid != os.getuid():
+            raise PermissionError(f'{cached} belongs to another user')
+        return {tuple(path): value for path, value in json.load(handle)}
+
+def write_cache(cached, content):
+    text = json.dumps([[list(path), value] for path, value in content.items()])
+    # Values JSON can't represent exactly (dates, tuples, non str keys...)
+    # are not cached
+    if {tuple(path): value for path, value in json.loads(text)} != content:
+        return
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    temporary = f'{cached}.{os.getpid()}'
+    with open(temporary, 'w') as handle:
+        handle.write(text)
+    os.replace(temporary, cached)
+
+def load_config_file(fname, cache=None):
+    # Returns the flattened content of the file and the backend used to
+    # parse it. By default the cache is only used when a cache dir is
+    # configured
+    if cache is None:
+        cache = 'FASTARGS_CACHE_DIR' in os.environ
+
+    if cache:
+        cached = cache_path(fname)
+        try:
+            return read_cache(cached), 'cache'
+        except Exception:
+            pass
+
+    with open(fname) as handle:
+        content, backend = parse(fname, handle.read())
+    content = flatten_keys(content or {})
+
+    if cache:
+        try:
+            write_cache(cached, content)
+        except (OSError, TypeError, ValueError):
+            pass  # The cache is only an optimization
+
+    return content, backend
@@ -0,0 +1,70 @@
+from collections import ChainMap, defaultdict
+from threading import RLock
+
+from .config import Config
+from .dict_utils import to_path
+
+
+class OverlayConfig(Config):
+    # Child config that only stores the overridden values and reads the
+    # rest from its parent. Entries and sections are shared with the parent
+    # so creating one costs O(overrides)
+
+    def __init__(self, parent, overrides, validated=None):
+        self.parent = parent
+        self.sections = parent.sections
+        self.sections_to_entries = parent.sections_to_entries
+        self.entries = parent.entries
+        self.index = parent.index
+        self.section_index = parent.section_index
+        # Entries are shared, so are the queues of the collects in progress:
+        # entries declared while collecting into any of the configs reach them
+        self.collecting = parent.collecting
+        self.overrides = {to_path(path): value
+                          for path, value in overrides.items()}
+        # Writes (collect) only ever go to the overrides
+        self.content = ChainMap(self.overrides, parent.content)
+        self.loaded_files = []
+        # Overridden values that were validated ahead of time
+        self.validated = {} if validated is None else validated
+        self.cache = {}
+        self.version = 0
+        self.enabled = {}
+        self.dependents = defaultdict(set)
+        self.evaluating = []
+        self.recording = None
+        self.condition_lock = RLock()
+        self.overlays = None
+        self.fingerprints = None
+        self.profiler = None
+        parent.add_overlay(self)
+
+    def add_section(self, section):
+        self.parent.add_section(section)
+
+    def add_entry(self, ns, name, param):
+        self.parent.add_entry(ns, name, param)
+
+    def collect(self, config):
+        self.validated.clear()
+        return super().collect(config)
+
+    def resolve_value(self, path, param):
+        if path in self.overrides:
+            try:
+                return self.validated[path]
+            except KeyError:
+                return super().resolve_value(path, param)
+
+        # Reuse the value (and cache) of the parent unless the section is
+        # only enabled in the overlay
+        section = param.section
+        if section is None or self.parent.section_enabled(section):
+            return self.parent.lookup(path)
+        return self.parent.resolve_value(path, param)
+
+    def __reduce__(self):
+        return self.compile().__reduce__()
+
+    def __repr__(self):
+        return f'OverlayConfig({len(self.overrides)} overrides)'
@@ -0,0 +1,86 @@
+import contextvars
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from .exceptions import MissingValueError, ValidationError
+from .param import PendingCheck, DeferredParam
+
+
+def check_value(checker, value):
+    # Failed checks are returned so that they can't be confused with the
+    # pool failing (eg. a value that can't be pickled)
+    try:
+        return True, checker.check(value)
+    except Exception:
+        return False, None
+
+
+def process_context():
+    # Never fork this (possibly multi-threaded) process: a lock held by
+    # another thread, eg. the import lock, would stay held in the child
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        'forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def validate_parallel(config, items, workers):
+    # Resolves the (path, param) items with a pool of threads, the checks of
+    # process safe checkers run in a pool of processes. Returns the values
+    # and the errors, as the sequential validation would
+    values = {}
+    errors = {}
+    threads = None
+    processes = None
+    try:
+        # The values checked in other processes are looked up, and sent,
+        # before any thread starts
+        futures = {}
+        in_threads = []
+        for path, param in items:
+            if not param.checker.process_safe:
+                in_threads.append((path, param))
+                continue
+            try:
+                value = config.resolve_value(path, DeferredParam(param))
+            except (MissingValueError, ValidationError) as e:
+                errors[path] = e
+                continue
+            if isinstance(value, PendingCheck):
+                if processes is None:
+                    processes = ProcessPoolExecutor(workers, mp_context=process_context())
+                future = processes.submit(check_value, param.checker, value.value)
+                futures[path] = (param, value.value, future)
+            else:
+                values[path] = value
+
+        if in_threads:
+            threads = ThreadPoolExecutor(workers)
+            for path, param in in_threads:
+                # Checks run in the context of the caller: code they import
+                # declares its params in the scoped current config, if any
+                context = contextvars.copy_context()
+                future = threads.submit(context.run, config.resolve_value,
+                                        path, param)
+                futures[path] = (param, None, future)
+
+        for path, (param, pending, future) in futures.items():
+            try:
+                result = future.result()
+            except (MissingValueError, ValidationError) as e:
+                errors[path] = e
+                continue
+            if pending is None:
+                values[path] = result
+                continue
+            valid, value = result
+            if valid:
+                values[path] = value
+            else:
+                errors[path] = param.validation_error(pending)
+    finally:
+        if threads is not None:
+            threads.shutdown()
+        if processes is not None:
+            processes.shutdown()
+
+    return values, errors
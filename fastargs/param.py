@@ -1,6 +1,10 @@
 from . import validation
 from .exceptions import MissingValueError, ValidationError
 
+# Generating the compiled checker costs more than a few plain checks, we
+# only do it for params that are validated repeatedly
+COMPILE_AFTER = 2
+
 class Param:
     def __init__(self, checker, desc='', default=None, required=False,
                  is_flag=False):
@@ -10,6 +14,8 @@ class Param:
         self.required = required
         self.is_flag = is_flag
         self.section = None
+        self.check = None
+        self.validations = 0
 
     def __str__(self):
         result = ""
@@ -33,9 +39,48 @@ class Param:
     def validate(self, value):
         if value is None and self.required:
             raise MissingValueError()
+        check = self.check
+        if check is None:
+            self.validations += 1
+            if self.validations > COMPILE_AFTER:
+                check = self.check = self.checker.compile()
+            else:
+                check = self.checker.check
         try:
-            return self.checker.check(value)
+            return check(value)
         except Exception:
-            msg = f'value `{value}` does not fit checker for `{self.checker.help()}`'
-            raise ValidationError(msg)
+            raise self.validation_error(value)
+
+    def validation_error(self, value):
+        msg = f'value `{value}` does not fit checker for `{self.checker.help()}`'
+        return ValidationError(msg)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['check'] = None
+        return state
+
+
+class PendingCheck:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
 
+
+class DeferredParam:
+    # Stands for a param in Config.resolve_value: the value is found the
+    # usual way but instead of being checked it is returned wrapped, to be
+    # checked later (with the other values of the same checker, or in
+    # another process)
+
+    def __init__(self, param):
+        self.param = param
+
+    def __getattr__(self, name):
+        return getattr(self.param, name)
+
+    def validate(self, value):
+        if value is None and self.param.required:
+            raise MissingValueError()
+        return PendingCheck(value)
@@ -0,0 +1,151 @@
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+from .state import get_current_config
+
+
+class Profiler:
+    # Statistics about how a config is used. While attached, the class of
+    # the config is swapped for an instrumented subclass: configs that are
+    # not profiled run the exact same code as before
+
+    def __init__(self, sinks=()):
+        # Number of reads per path (as requested, str or tuple)
+        self.accesses = defaultdict(int)
+        # Time spent looking up and validating the value of each path
+        self.validation = defaultdict(float)
+        # [calls, seconds] per collection source and per decorated function
+        self.sources = defaultdict(lambda: [0, 0.0])
+        self.functions = defaultdict(lambda: [0, 0.0])
+        self.sinks = list(sinks)
+        # Profiler and class of the configs before they were attached
+        self.previous = {}
+
+    def attach(self, config):
+        # Profilers can be nested, the innermost one records and detaching
+        # it gives the config back to the previous one
+        self.previous[id(config)] = (config.profiler, type(config))
+        config.profiler = self
+        config.__class__ = profiled_class(type(config))
+        return self
+
+    def detach(self, config):
+        if config.profiler is not self:
+            raise RuntimeError('Profilers of a config must be detached in '
+                               'the reverse order they were attached')
+        config.profiler, config.__class__ = self.previous.pop(id(config))
+        return self
+
+    @contextmanager
+    def timed(self, table, key):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            stats = table[key]
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+
+    def report(self):
+        accesses = defaultdict(int)
+        for path, count in self.accesses.items():
+            accesses[dotted(path)] += count
+        validation = defaultdict(float)
+        for path, seconds in self.validation.items():
+            validation[dotted(path)] += seconds
+
+        def table(stats):
+            return {key: {'calls': calls, 'seconds': seconds}
+                    for key, (calls, seconds) in stats.items()}
+
+        return {
+            'accesses': dict(accesses),
+            'validation': dict(validation),
+            'sources': table(self.sources),
+            'functions': table(self.functions),
+        }
+
+    def flush(self):
+        if self.sinks:
+            report = self.report()
+            for sink in self.sinks:
+                sink(report)
+
+
+def dotted(path):
+    return path if isinstance(path, str) else '.'.join(path)
+
+
+def json_sink(fname):
+    def sink(report):
+        with open(fname, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+    return sink
+
+
+@contextmanager
+def profile(config=None, sinks=()):
+    # with profile(sinks=[print]) as profiler: ...
+    if config is None:
+        config = get_current_config()
+    profiler = Profiler(sinks).attach(config)
+    try:
+        yield profiler
+    finally:
+        profiler.detach(config)
+        profiler.flush()
+
+
+class ProfiledConfig:
+    # Mixed in front of the class of profiled configs. Every instrumented
+    # operation is its own method so they also show up as such in cProfile
+
+    def __getitem__(self, path):
+        self.profiler.accesses[path] += 1
+        return super().__getitem__(path)
+
+    def resolve_value(self, path, param):
+        start = perf_counter()
+        try:
+            return super().resolve_value(path, param)
+        finally:
+            self.profiler.validation[path] += perf_counter() - start
+
+    def collect(self, config):
+        with self.profiler.timed(self.profiler.sources, 'collect'):
+            return super().collect(config)
+
+    def collect_config_file(self, fname, cache=None):
+        with self.profiler.timed(self.profiler.sources, 'config_file'):
+            return super().collect_config_file(fname, cache)
+
+    def collect_json(self, fname):
+        with self.profiler.timed(self.profiler.sources, 'json'):
+            return super().collect_json(fname)
+
+    def collect_yaml(self, fname):
+        with self.profiler.timed(self.profiler.sources, 'yaml'):
+            return super().collect_yaml(fname)
+
+    def collect_env_variables(self, prefix=None):
+        with self.profiler.timed(self.profiler.sources, 'env'):
+            return super().collect_env_variables(prefix)
+
+    def collect_argparse_args(self, parser, disable_help=False, env_prefix=None):
+        with self.profiler.timed(self.profiler.sources, 'argparse'):
+            return super().collect_argparse_args(parser, disable_help, env_prefix)
+
+
+PROFILED_CLASSES = {}
+
+def profiled_class(cls):
+    if issubclass(cls, ProfiledConfig):
+        return cls
+    try:
+        return PROFILED_CLASSES[cls]
+    except KeyError:
+        profiled = type(f'Profiled{cls.__name__}', (ProfiledConfig, cls), {})
+        PROFILED_CLASSES[cls] = profiled
+        return profiled
@@ -1,4 +1,5 @@
 from .state import get_current_config
+from .exceptions import CyclicConditionError
 
 class Section:
     def __init__(self, ns, desc=None,
@@ -16,14 +17,17 @@ class Section:
 
     def enable_if(self, condition):
         self.condition = condition
+        self.config_descriptor.invalidate()
         return self
 
     def is_enabled(self, config):
         if self.condition is None:
             return True
         try:
-            return self.condition(config)
-        except:
+            return bool(self.condition(config))
+        except CyclicConditionError:
+            raise
+        except Exception:
             return False
 
 
@@ -1,13 +1,44 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
 STATE = {
     'config': None
 }
 
+# Config of the current thread / asyncio task, it takes precedence over the
+# process wide one in STATE
+SCOPED_CONFIG = ContextVar('fastargs_config', default=None)
+
+# Only taken to create the default config, reads never lock
+CREATION_LOCK = Lock()
+
 def get_current_config():
-    if STATE['config'] is None:
-        from .config import Config
-        STATE['config'] = Config()
+    config = SCOPED_CONFIG.get()
+    if config is not None:
+        return config
 
-    return STATE['config']
+    config = STATE['config']
+    if config is None:
+        with CREATION_LOCK:
+            if STATE['config'] is None:
+                from .config import Config
+                STATE['config'] = Config()
+            config = STATE['config']
+
+    return config
 
 def set_current_config(config):
-    STATE['config'] = config
+    # Inside a use_config block only the scoped config is replaced
+    if SCOPED_CONFIG.get() is not None:
+        SCOPED_CONFIG.set(config)
+    else:
+        STATE['config'] = config
+
+@contextmanager
+def use_config(config):
+    token = SCOPED_CONFIG.set(config)
+    try:
+        yield config
+    finally:
+        SCOPED_CONFIG.reset(token)
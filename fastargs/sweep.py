@@ -0,0 +1,111 @@
+# Hyperparameter sweeps over a base config. Trials are OverlayConfigs
+# generated lazily and the values of an axis are validated once, not once
+# per trial they appear in
+import itertools
+import random
+
+from .dict_utils import to_path
+from .exceptions import ValidationError
+from .overlay import OverlayConfig
+from .state import get_current_config
+
+# Validated values remembered per sampled axis, continuous samplers rarely
+# repeat a value so this bounds the memory of long random searches
+SAMPLE_MEMO_SIZE = 1024
+
+
+def validate_value(config, path, value):
+    try:
+        param = config.entries[path]
+    except KeyError:
+        raise KeyError(f"{'.'.join(path)} not defined")
+    if value is None:
+        return None
+    try:
+        return param.validate(value)
+    except ValidationError as e:
+        raise ValidationError(f"{'.'.join(path)}: {e}") from e
+
+
+def prepare_axes(config, spec):
+    # [(path, raw values, validated values)]
+    axes = []
+    for path, values in spec.items():
+        path = to_path(path)
+        values = list(values)
+        axes.append((path, values,
+                     [validate_value(config, path, v) for v in values]))
+    return axes
+
+
+def make_trial(config, axes, indices):
+    overrides = {}
+    validated = {}
+    for (path, values, checked), i in zip(axes, indices):
+        overrides[path] = values[i]
+        if checked[i] is not None:
+            validated[path] = checked[i]
+    return OverlayConfig(config, overrides, validated)
+
+
+def grid(spec, config=None):
+    # Every combination of the values, the last axis varies the fastest
+    if config is None:
+        config = get_current_config()
+    axes = prepare_axes(config, spec)
+    ranges = [range(len(values)) for _, values, _ in axes]
+    for indices in itertools.product(*ranges):
+        yield make_trial(config, axes, indices)
+
+
+def zipped(spec, config=None):
+    # The i-th trial takes the i-th value of every axis
+    if config is None:
+        config = get_current_config()
+    axes = prepare_axes(config, spec)
+    lengths = {len(values) for _, values, _ in axes}
+    if len(lengths) > 1:
+        raise ValueError(f'Zipped axes have different lengths: {sorted(lengths)}')
+    for i in range(lengths.pop() if lengths else 0):
+        yield make_trial(config, axes, [i] * len(axes))
+
+
+def random_search(spec, trials, config=None, seed=None):
+    # Axes are either a list of values to pick from or a function sampling
+    # a value from a random.Random
+    if config is None:
+        config = get_current_config()
+    rng = random.Random(seed)
+
+    samplers = []
+    for path, axis in spec.items():
+        path = to_path(path)
+        if callable(axis):
+            samplers.append((path, axis, {}))
+        else:
+            values = list(axis)
+            checked = [validate_value(config, path, v) for v in values]
+            samplers.append((path, values, checked))
+
+    for _ in range(trials):
+        overrides = {}
+        validated = {}
+        for path, axis, checked in samplers:
+            if isinstance(axis, list):
+                i = rng.randrange(len(axis))
+                value, result = axis[i], checked[i]
+            else:
+                value = axis(rng)
+                try:
+                    result = checked[value]
+                except (KeyError, TypeError):
+                    result = validate_value(config, path, value)
+                    if len(checked) < SAMPLE_MEMO_SIZE:
+                        try:
+                            checked[value] = result
+                        except TypeError:
+                            pass
+            overrides[path] = value
+            if result is not None:
+                validated[path] = result
+        yield OverlayConfig(config, overrides, validated)
@@ -1,8 +1,28 @@
 import importlib
+import sys
 from abc import ABC, abstractmethod
 
 
+def is_array(value):
+    # Never imports numpy, if it is not loaded value can't be an array
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+def split_list(value):
+    # Lists coming from the CLI or env variables: "1,2,3"
+    if not value.strip():
+        return []
+    return [x.strip() for x in value.split(',')]
+
+
 class Checker(ABC):
+    # Whether check accepts a whole numpy array and checks every element
+    vectorized = False
+    # Whether check can run in another process: the checker, the values and
+    # the results can be pickled and checking has no side effect that
+    # matters to this process (eg. imports declaring params)
+    process_safe = False
+
     @abstractmethod
     def check(self, value):
         raise NotImplementedError
@@ -11,6 +31,91 @@ class Checker(ABC):
     def help(self) -> str:
         raise NotImplementedError
 
+    def compile(self):
+        # Equivalent of check as a single generated function
+        try:
+            return self.__dict__['_compiled']
+        except KeyError:
+            compiled = CodeGenerator().build(self)
+            self.__dict__['_compiled'] = compiled
+            return compiled
+
+    def generate(self, gen, src, dst, guarded):
+        # Emits the code storing the checked `src` into `dst`. When guarded,
+        # failures store FAIL in `dst` instead of raising.
+        gen.call(gen.constant(self.check, 'check'), src, dst, guarded)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_compiled', None)
+        return state
+
+
+FAIL = object()
+
+COMPILED_CODE = {}
+
+
+class CodeGenerator:
+    def __init__(self):
+        self.lines = []
+        self.depth = 1
+        self.namespace = {'FAIL': FAIL}
+        self.counter = 0
+
+    def name(self, prefix='v'):
+        self.counter += 1
+        return f'{prefix}{self.counter}'
+
+    def constant(self, value, prefix='c'):
+        name = self.name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line):
+        self.lines.append('    ' * self.depth + line)
+
+    def fail(self, dst, guarded, exception='ValueError()'):
+        if guarded:
+            self.emit(f'{dst} = FAIL')
+        else:
+            self.emit(f'raise {exception}')
+
+    def call(self, function, src, dst, guarded):
+        if not guarded:
+            self.emit(f'{dst} = {function}({src})')
+            return
+        self.emit('try:')
+        self.depth += 1
+        self.emit(f'{dst} = {function}({src})')
+        self.depth -= 1
+        self.emit('except Exception:')
+        self.depth += 1
+        self.emit(f'{dst} = FAIL')
+        self.depth -= 1
+
+    def generate(self, checker, src, dst, guarded):
+        # Subclasses overriding check without generate get a plain call
+        mro = type(checker).__mro__
+        definer = next(c for c in mro if 'generate' in c.__dict__)
+        if mro.index(definer) > next(i for i, c in enumerate(mro)
+                                     if 'check' in c.__dict__):
+            definer = Checker
+        definer.generate(checker, self, src, dst, guarded)
+
+    def build(self, checker):
+        self.generate(checker, 'value', 'result', False)
+        source = '\n'.join(['def check(value):'] + self.lines
+                           + ['    return result', ''])
+        # Checkers with the same structure share the compiled code
+        try:
+            code = COMPILED_CODE[source]
+        except KeyError:
+            code = compile(source, f'<checker {checker.help()}>', 'exec')
+            COMPILED_CODE[source] = code
+        exec(code, self.namespace)
+        return self.namespace['check']
+
 
 def get_checker(checker):
     if checker in DEFAULT_CHECKERS:
@@ -25,6 +130,16 @@ class Int(Checker):
     def check(self, value):
         return int(value)
 
+    def generate(self, gen, src, dst, guarded):
+        gen.emit(f'if type({src}) is int:')
+        gen.depth += 1
+        gen.emit(f'{dst} = {src}')
+        gen.depth -= 1
+        gen.emit('else:')
+        gen.depth += 1
+        gen.call('int', src, dst, guarded)
+        gen.depth -= 1
+
     def help(self):
         return "an int"
 
@@ -40,6 +155,16 @@ class Float(Checker):
     def check(self, value):
         return float(value)
 
+    def generate(self, gen, src, dst, guarded):
+        gen.emit(f'if type({src}) is float:')
+        gen.depth += 1
+        gen.emit(f'{dst} = {src}')
+        gen.depth -= 1
+        gen.emit('else:')
+        gen.depth += 1
+        gen.call('float', src, dst, guarded)
+        gen.depth -= 1
+
     def help(self):
         return "a float"
 
@@ -50,14 +175,29 @@ class Str(Checker):
             return value
         raise TypeError()
 
+    def generate(self, gen, src, dst, guarded):
+        gen.emit(f'if isinstance({src}, str):')
+        gen.depth += 1
+        gen.emit(f'{dst} = {src}')
+        gen.depth -= 1
+        gen.emit('else:')
+        gen.depth += 1
+        gen.fail(dst, guarded, 'TypeError()')
+        gen.depth -= 1
+
     def help(self):
         return "a string"
 
 
 class Anything(Checker):
+    vectorized = True
+
     def check(self, value):
         return value
 
+    def generate(self, gen, src, dst, guarded):
+        gen.emit(f'{dst} = {src}')
+
     def help(self):
         return "anything"
 
@@ -75,12 +215,27 @@ class Or(Checker):
                 pass
         raise ValueError("None of the condition are valid")
 
+    def generate(self, gen, src, dst, guarded):
+        # Each branch only runs if the previous ones failed, common
+        # conversions don't go through exceptions
+        depth = gen.depth
+        for checker in self.checkers:
+            gen.generate(checker, src, dst, True)
+            gen.emit(f'if {dst} is FAIL:')
+            gen.depth += 1
+        if guarded:
+            gen.emit(f'{dst} = FAIL')
+        else:
+            gen.emit('raise ValueError("None of the condition are valid")')
+        gen.depth = depth
+
     def help(self):
         return ' or '.join([x.help() for x in self.checkers])
 
 class And(Checker):
     def __init__(self, *checkers):
         self.checkers = [get_checker(x) for x in checkers]
+        self.vectorized = all(x.vectorized for x in self.checkers)
 
     def check(self, value):
         result = value
@@ -88,20 +243,72 @@ class And(Checker):
             result = checker.check(result)
         return result
 
+    def generate(self, gen, src, dst, guarded):
+        depth = gen.depth
+        if guarded:
+            gen.emit(f'{dst} = FAIL')
+        current = src
+        for i, checker in enumerate(self.checkers):
+            last = i == len(self.checkers) - 1
+            target = dst if last else gen.name()
+            gen.generate(checker, current, target, guarded)
+            if guarded and not last:
+                gen.emit(f'if {target} is not FAIL:')
+                gen.depth += 1
+            current = target
+        if current is src:
+            gen.emit(f'{dst} = {src}')
+        gen.depth = depth
+
     def help(self):
         return ' and '.join([x.help() for x in self.checkers])
 
 class InRange(Checker):
+    vectorized = True
 
     def __init__(self, min=float('-inf'), max=float('+inf')):
         self.low = min
         self.high = max
 
     def check(self, value):
+        if is_array(value):
+            # Whole array at once, NaNs pass like they do for scalars
+            if (value < self.low).any() or (value > self.high).any():
+                raise ValueError()
+            return value
         if value < self.low or value > self.high:
             raise ValueError()
         return value
 
+    def generate(self, gen, src, dst, guarded):
+        # Arrays and exotic types go through check
+        gen.emit(f'if type({src}) is not int and type({src}) is not float:')
+        gen.depth += 1
+        Checker.generate(self, gen, src, dst, guarded)
+        gen.depth -= 1
+        gen.emit('else:')
+        gen.depth += 1
+        low = gen.constant(self.low, 'low')
+        high = gen.constant(self.high, 'high')
+        if guarded:
+            gen.emit('try:')
+            gen.depth += 1
+        gen.emit(f'if {src} < {low} or {src} > {high}:')
+        gen.depth += 1
+        gen.fail(dst, guarded)
+        gen.depth -= 1
+        gen.emit('else:')
+        gen.depth += 1
+        gen.emit(f'{dst} = {src}')
+        gen.depth -= 1
+        if guarded:
+            gen.depth -= 1
+            gen.emit('except Exception:')
+            gen.depth += 1
+            gen.emit(f'{dst} = FAIL')
+            gen.depth -= 1
+        gen.depth -= 1
+
     def help(self):
         return f"between {self.low} and {self.high}"
 
@@ -115,34 +322,158 @@ class OneOf(Checker):
             raise ValueError()
         return value
 
+    def generate(self, gen, src, dst, guarded):
+        possible = gen.constant(self.possible_values, 'possible')
+        if guarded:
+            gen.emit('try:')
+            gen.depth += 1
+        gen.emit(f'if {src} not in {possible}:')
+        gen.depth += 1
+        gen.fail(dst, guarded)
+        gen.depth -= 1
+        gen.emit('else:')
+        gen.depth += 1
+        gen.emit(f'{dst} = {src}')
+        gen.depth -= 1
+        if guarded:
+            gen.depth -= 1
+            gen.emit('except Exception:')
+            gen.depth += 1
+            gen.emit(f'{dst} = FAIL')
+            gen.depth -= 1
+
     def help(self):
         return f"One of [{', '.join([str(x) for x in self.possible_values])}]"
 
-class Module(Checker):
+def import_module(value):
+    return importlib.import_module(value)
 
-    def __init__(self):
-        pass
+def import_object(value):
+    path = value.split('.')
+    module = '.'.join(path[:-1])
+    imported = importlib.import_module(module)
+    return getattr(imported, path[-1])
+
+
+class LazyObject:
+    # Stands for an object that is only imported on first use
+    __slots__ = ('name', 'load', 'target')
+
+    def __init__(self, name, load):
+        self.name = name
+        self.load = load
+        self.target = None
+
+    def resolve(self):
+        target = self.target
+        if target is None:
+            target = self.target = self.load(self.name)
+        return target
+
+    def __getattr__(self, attribute):
+        return getattr(self.resolve(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __dir__(self):
+        return dir(self.resolve())
+
+    def __repr__(self):
+        return f'<lazy import of {self.name}>'
+
+    def __reduce__(self):
+        return LazyObject, (self.name, self.load)
+
+
+class ImportChecker(Checker):
+    # Resolved objects are memoized per value, in lazy mode the import
+    # only happens when the result is first used
+
+    def __init__(self, lazy=False):
+        self.lazy = lazy
+        self.imported = {}
 
     def check(self, value):
-        return importlib.import_module(value)
+        try:
+            return self.imported[value]
+        except KeyError:
+            pass
+        if self.lazy:
+            if not isinstance(value, str):
+                raise TypeError()
+            result = LazyObject(value, self.load)
+        else:
+            result = self.load(value)
+        self.imported[value] = result
+        return result
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['imported'] = {}
+        return state
+
+class Module(ImportChecker):
+    load = staticmethod(import_module)
 
     def help(self):
         return "path to python module"
 
-class ImportedObject(Checker):
+class ImportedObject(ImportChecker):
+    load = staticmethod(import_object)
 
-    def __init__(self):
-        pass
+    def help(self):
+        return "path to python module and an object within"
+
+
+class ListOf(Checker):
+
+    def __init__(self, checker):
+        self.checker = get_checker(checker)
 
     def check(self, value):
-        path = value.split('.')
-        module = '.'.join(path[:-1])
-        imported = importlib.import_module(module)
-        return getattr(imported, path[-1])
+        if isinstance(value, str):
+            value = split_list(value)
+        elif is_array(value):
+            if self.checker.vectorized:
+                return self.checker.check(value)
+            value = value.tolist()
+        elif not isinstance(value, (list, tuple)):
+            raise TypeError()
+        check = self.checker.compile()
+        return [check(x) for x in value]
+
+    def help(self):
+        return f"a list of ({self.checker.help()})"
 
+class ArrayOf(Checker):
+    vectorized = True
+
+    def __init__(self, dtype, shape=None):
+        self.dtype = dtype
+        # None in the shape matches any size
+        self.shape = None if shape is None else tuple(shape)
+
+    def check(self, value):
+        import numpy as np
+        if isinstance(value, str):
+            value = split_list(value)
+        # Doesn't copy arrays that already have the right dtype
+        array = np.asarray(value, dtype=self.dtype)
+        if self.shape is not None:
+            if array.ndim != len(self.shape) or any(
+                    expected is not None and expected != size
+                    for expected, size in zip(self.shape, array.shape)):
+                raise ValueError()
+        return array
 
     def help(self):
-        return "path to python module and an object within"
+        dtype = getattr(self.dtype, '__name__', str(self.dtype))
+        result = f"an array of {dtype}"
+        if self.shape is not None:
+            shape = ', '.join('*' if x is None else str(x) for x in self.shape)
+            result += f" of shape ({shape})"
+        return result
 
 
 DEFAULT_CHECKERS = {
@@ -0,0 +1,40 @@
+from .dict_utils import NestedNamespace, rec_dd, recursive_set, fix_dict, to_path
+
+
+class ConfigView:
+    # Read-only window on the params under a prefix of a config, paths are
+    # given relative to that prefix
+
+    def __init__(self, config, prefix):
+        self.config = config
+        self.prefix = prefix
+
+    def __getitem__(self, path):
+        return self.config[self.prefix + to_path(path)]
+
+    def __contains__(self, path):
+        return (self.prefix + to_path(path)) in self.config.index
+
+    def __iter__(self):
+        return self.paths()
+
+    def paths(self):
+        start = len(self.prefix)
+        for path in self.config.index.paths(self.prefix):
+            if len(path) > start:
+                yield path[start:]
+
+    def view(self, prefix):
+        return ConfigView(self.config, self.prefix + to_path(prefix))
+
+    def get(self):
+        result = rec_dd()
+        for path in self.paths():
+            value = self[path]
+            if value is not None:
+                recursive_set(result, path, value)
+
+        return NestedNamespace(fix_dict(result))
+
+    def __repr__(self):
+        return f"ConfigView({'.'.join(self.prefix)})"
@@ -0,0 +1,117 @@
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from os import path
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.decorators import param
+from fastargs.exceptions import MissingValueError, ValidationError
+from fastargs.validation import Module, Anything
+
+sys.path.append(path.dirname(path.realpath(__file__)))
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        set_current_config((Config()))
+        self.folder = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.folder.name, 'config.bin')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_round_trip(self):
+        Section('a').params(
+            value=Param(int, required=True),
+            other=Param(Anything(), default=[1, {'x': 2}]),
+            unset=Param(int),
+            missing=Param(int, required=True),
+        )
+        Section('module.import').params(
+            module=Param(Module(), required=True)
+        )
+
+        get_current_config().collect({
+            'a.value': '3',
+            'module.import.module': 'test_module.file1'
+        }).dump_binary(self.fname)
+
+        cfg = Config.load_binary(self.fname)
+        self.assertEqual(cfg['a.value'], 3)
+        self.assertEqual(cfg['a.other'], [1, {'x': 2}])
+        self.assertIsNone(cfg['a.unset'])
+        self.assertEqual(cfg['module.import.module'].testme(), 42)
+        self.assertEqual(cfg.view('a')['value'], 3)
+        self.assertEqual(sorted(cfg.paths('a')), [
+            ('a', 'missing'), ('a', 'other'), ('a', 'unset'), ('a', 'value')
+        ])
+        with self.assertRaises(MissingValueError):
+            cfg['a.missing']
+        with self.assertRaises(KeyError):
+            cfg['a.not_declared']
+        self.assertEqual(len(cfg.entries), 5)
+        self.assertEqual(len(cfg.values), 4)
+
+        cfg = pickle.loads(pickle.dumps(cfg))
+        self.assertEqual(cfg['a.value'], 3)
+        sys.modules.pop('test_module.file1')
+
+    def test_worker_usage(self):
+        Section('a').params(
+            value=Param(int, required=True),
+        )
+        get_current_config().collect({'a.value': 5}).dump_binary(self.fname)
+
+        set_current_config(Config.load_binary(self.fname))
+        Section('a').params(
+            value=Param(int, required=True),
+        )
+        Section('b').params(
+            value=Param(int, default=2),
+        )
+
+        @param('a.value')
+        @param('b.value', 'other')
+        def compute(value, other):
+            return value * other
+
+        self.assertEqual(compute(), 10)
+        self.assertEqual(vars(get_current_config().get().a), {'value': 5})
+
+    def test_many_reads(self):
+        Section('many').params(**{f'p{i}': Param(int, default=i)
+                                  for i in range(200)})
+        get_current_config().dump_binary(self.fname)
+        cfg = Config.load_binary(self.fname)
+        for _ in range(2):
+            for i in range(200):
+                self.assertEqual(cfg[('many', f'p{i}')], i)
+        self.assertIsNone(cfg.values.snapshot.find(('many', 'nope')))
+        with self.assertRaises(KeyError):
+            cfg['many.nope']
+
+    def test_invalid_value(self):
+        Section('a').params(
+            x=Param(int, default=3),
+        )
+        get_current_config().collect({'a.x': 'abc'}).dump_binary(self.fname)
+
+        cfg = Config.load_binary(self.fname)
+        with self.assertRaises(ValidationError):
+            cfg['a.x']
+        errors = cfg.validate(mode='errordict')
+        self.assertIsInstance(errors[('a', 'x')], ValidationError)
+
+        cfg.collect({'a.x': '4'})
+        self.assertEqual(cfg['a.x'], 4)
+
+    def test_invalid_file(self):
+        with open(self.fname, 'wb') as handle:
+            handle.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            Config.load_binary(self.fname)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import io
+import pickle
+import sys
+import unittest
+from os import path
+from unittest.mock import patch
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.compiled import CompiledConfig
+from fastargs.decorators import param
+from fastargs.exceptions import MissingValueError, ValidationError
+from fastargs.validation import Module, InRange, And
+
+sys.path.append(path.dirname(path.realpath(__file__)))
+
+class TestCompiled(unittest.TestCase):
+    def setUp(self):
+        set_current_config((Config()))
+
+    def compile_example(self):
+        Section('a').params(
+            value=Param(And(int, InRange(min=0)), required=True),
+            default=Param(float, default=2.5),
+            unset=Param(int),
+        )
+        Section('b').enable_if(lambda cfg: cfg['a.value'] > 10).params(
+            value=Param(int, required=True)
+        )
+        Section('module.import').params(
+            module=Param(Module(), required=True)
+        )
+
+        return get_current_config().collect({
+            'a.value': '3',
+            'module.import.module': 'test_module.file1'
+        }).compile()
+
+    def test_values(self):
+        compiled = pickle.loads(pickle.dumps(self.compile_example()))
+
+        self.assertIsInstance(compiled, CompiledConfig)
+        self.assertEqual(compiled['a.value'], 3)
+        self.assertEqual(compiled['a.default'], 2.5)
+        self.assertIsNone(compiled['a.unset'])
+        self.assertIsNone(compiled['b.value'])
+        self.assertEqual(compiled['module.import.module'].testme(), 42)
+        self.assertEqual(compiled.get().a.value, 3)
+        self.assertEqual(len(compiled.validate('errordict')), 0)
+        with self.assertRaises(KeyError):
+            compiled['a.missing']
+        sys.modules.pop('test_module.file1')
+
+    def test_invalid_values(self):
+        Section('a').params(
+            value=Param(int, default=3),
+        )
+        cfg = get_current_config().collect({'a.value': 'abc'})
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            compiled = cfg.compile()
+        self.assertEqual(out.getvalue(), '')
+        with self.assertRaises(ValidationError):
+            compiled['a.value']
+
+    def test_worker_usage(self):
+        data = pickle.dumps(self.compile_example())
+
+        # What a fresh worker would do
+        set_current_config(pickle.loads(data))
+        Section('a').params(
+            value=Param(int, required=True),
+            default=Param(float, default=2.5),
+            unset=Param(int),
+        )
+        Section('c').params(
+            value=Param(int, required=True)
+        )
+
+        @param('a.value')
+        @param('a.default')
+        def compute(value, default):
+            return value * default
+
+        self.assertEqual(compute(), 7.5)
+
+        cfg = get_current_config()
+        with self.assertRaises(MissingValueError):
+            cfg['c.value']
+
+        cfg.collect({'a.value': 4, 'c.value': 1})
+        self.assertEqual(compute(), 10)
+        self.assertEqual(cfg['c.value'], 1)
+
+        # Still picklable after live params were declared
+        self.assertEqual(pickle.loads(pickle.dumps(cfg))['a.value'], 4)
+        sys.modules.pop('test_module.file1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
+import io
 import unittest
+from unittest.mock import patch
 
 from fastargs import Config, set_current_config, get_current_config, Section, Param
 from fastargs.validation import Anything, Str, Int, Float, And, Or, InRange
 from fastargs.decorators import param, section
+from fastargs.exceptions import MissingValueError, ValidationError
 
 class TestDecorators(unittest.TestCase):
     def setUp(self):
@@ -150,6 +153,104 @@ class TestDecorators(unittest.TestCase):
 
         self.assertEqual(compute(p1=17), 17)
 
+    def test_rebinds_after_collect(self):
+        Section('sec1').params(
+            p1=Param(int),
+        )
+
+        @param('sec1.p1')
+        def compute(p1):
+            return p1
+
+        cfg = get_current_config()
+        cfg.collect({'sec1.p1': 1})
+        self.assertEqual(compute(), 1)
+        cfg.collect({'sec1.p1': 2})
+        self.assertEqual(compute(), 2)
+
+        set_current_config(Config())
+        Section('sec1').params(
+            p1=Param(int, default=3),
+        )
+        self.assertEqual(compute(), 3)
+
+    def test_frozen_current_config(self):
+        Section('sec1').params(
+            p1=Param(int, default=4),
+        )
+
+        @param('sec1.p1')
+        def compute(p1):
+            return p1
+
+        set_current_config(get_current_config().freeze())
+        self.assertEqual(compute(), 4)
+        self.assertEqual(compute(p1=1), 1)
+
+    def test_invalid_args(self):
+        Section('sec1').params(
+            p1=Param(int, required=True),
+            p2=Param(int),
+        )
+
+        @param('sec1.p1')
+        @param('sec1.p2')
+        def compute(p1, p2):
+            return p1 - p2
+
+        cfg = get_current_config().collect({'sec1.p2': 'x'})
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            with self.assertRaises(MissingValueError):
+                compute(p2=1)
+            with self.assertRaises(ValidationError):
+                compute(p1=3)
+            with self.assertRaises(ValidationError):
+                compute(p1=3)
+        self.assertEqual(out.getvalue().count('Issue when typechecking'), 1)
+        self.assertEqual(compute(p1=3, p2=1), 2)
+
+        cfg.collect({'sec1.p1': 5, 'sec1.p2': 2})
+        self.assertEqual(compute(), 3)
+
+    def test_bind(self):
+        Section('sec1').params(
+            p1=Param(int),
+            p2=Param(int),
+        )
+
+        @param('sec1.p1')
+        @param('sec1.p2')
+        def compute(p1, p2):
+            return p1 - p2
+
+        cfg = get_current_config()
+        cfg.collect({'sec1.p1': 5, 'sec1.p2': 2})
+        bound = compute.bind()
+        cfg.collect({'sec1.p1': 10})
+
+        self.assertEqual(bound(), 3)
+        self.assertEqual(bound(p2=1), 4)
+        self.assertEqual(compute(), 8)
+
+    def test_section_on_method(self):
+        Section('sec1').params(
+            p1=Param(int),
+        )
+
+        class TestClass:
+
+            @section('sec1')
+            @param('p1')
+            def compute(self, p1):
+                return (self, p1)
+
+        get_current_config().collect({
+            'sec1.p1': 42,
+        })
+
+        instance = TestClass()
+        self.assertEqual(instance.compute(), (instance, 42))
+
 
 if __name__ == '__main__':
     unittest.main()
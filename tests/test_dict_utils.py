@@ -0,0 +1,61 @@
+import unittest
+
+from fastargs.dict_utils import (expand_keys, flatten_keys, recursive_get,
+                                 recursive_set, rec_dd, fix_dict, PathTrie)
+
+class TestDictUtils(unittest.TestCase):
+
+    def test_expand_keys(self):
+        expanded = expand_keys({
+            'a.b': 1,
+            'a': {'c': 2, 'd.e': 3},
+            'f': {},
+        })
+        self.assertEqual(expanded, {'a': {'b': 1, 'c': 2, 'd': {'e': 3}}})
+        self.assertIs(type(expanded['a']), dict)
+
+    def test_later_keys_override(self):
+        self.assertEqual(expand_keys({'a': {'b': 1}, 'a.b': 2}),
+                         {'a': {'b': 2}})
+        self.assertEqual(expand_keys({'a.b': 2, 'a': {'b': 1}}),
+                         {'a': {'b': 1}})
+
+    def test_flatten_keys(self):
+        flat = flatten_keys({'a.b': 1, 'a': {'c': {'d': 2}}, 'e': [1, 2]})
+        self.assertEqual(flat, {
+            ('a', 'b'): 1,
+            ('a', 'c', 'd'): 2,
+            ('e',): [1, 2],
+        })
+        self.assertEqual(expand_keys(flat), {'a': {'b': 1, 'c': {'d': 2}},
+                                             'e': [1, 2]})
+
+    def test_recursive_get_set(self):
+        tree = rec_dd()
+        recursive_set(tree, ('a', 'b', 'c'), 1)
+        recursive_set(tree, ('a', 'd'), 2)
+        tree = fix_dict(tree)
+        self.assertEqual(tree, {'a': {'b': {'c': 1}, 'd': 2}})
+        self.assertEqual(recursive_get(tree, ('a', 'b', 'c')), 1)
+        self.assertEqual(recursive_get(tree, ('a', 'b')), {'c': 1})
+        self.assertIs(recursive_get(tree, ()), tree)
+
+    def test_path_trie(self):
+        trie = PathTrie()
+        for path in [('a', 'b'), ('a', 'c', 'd'), ('e',), ('a', 'c')]:
+            trie.insert(path, '.'.join(path))
+
+        self.assertIn(('a', 'c'), trie)
+        self.assertNotIn(('a',), trie)
+        self.assertIsNone(trie.find(('x', 'y')))
+        self.assertEqual(list(trie.paths(('a',))),
+                         [('a', 'b'), ('a', 'c'), ('a', 'c', 'd')])
+        self.assertEqual(list(trie.items(('a', 'c', 'd'))),
+                         [(('a', 'c', 'd'), 'a.c.d')])
+        self.assertEqual(list(trie.paths(('z',))), [])
+        self.assertEqual(trie.longest_prefix(('a', 'c', 'x')), 'a.c')
+        self.assertIsNone(trie.longest_prefix(('a', 'x')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import subprocess
+import sys
+import unittest
+from os import path
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.exceptions import MissingValueError
+from fastargs.fingerprint import FingerprintIndex, encoded
+from fastargs.validation import Anything, Module
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestFingerprint(unittest.TestCase):
+    def setUp(self):
+        set_current_config(Config())
+        Section('training').params(
+            lr=Param(float, default=0.1),
+            layers=Param(Anything(), default=[64, {'b': 1, 'a': 2}]),
+        )
+        Section('data').params(
+            path=Param(str),
+            weights=Param(Anything()),
+        )
+
+    def test_stable(self):
+        cfg = get_current_config()
+        first = cfg.fingerprint()
+        self.assertEqual(cfg.fingerprint(), first)
+        self.assertEqual(len(first), 64)
+
+        script = ("from tests.test_fingerprint import TestFingerprint\n"
+                  "t = TestFingerprint(); t.setUp()\n"
+                  "from fastargs import get_current_config\n"
+                  "print(get_current_config().fingerprint())\n")
+        other = subprocess.run([sys.executable, '-c', script], check=True,
+                               capture_output=True, text=True,
+                               env={'PYTHONHASHSEED': '123'},
+                               cwd=path.dirname(path.dirname(path.realpath(__file__))))
+        self.assertEqual(other.stdout.strip(), first)
+
+    def test_changes(self):
+        cfg = get_current_config()
+        first = cfg.fingerprint()
+        training = cfg.fingerprint('training')
+        data = cfg.fingerprint('data')
+
+        cfg.collect({'data.path': '/tmp'})
+        self.assertNotEqual(cfg.fingerprint(), first)
+        self.assertEqual(cfg.fingerprint('training'), training)
+        self.assertNotEqual(cfg.fingerprint('data'), data)
+
+        cfg.collect({'data.path': 'other'})
+        cfg.collect({'data.path': '/tmp'})
+        self.assertNotEqual(cfg.fingerprint(), first)
+        self.assertEqual(cfg.fingerprint('data'),
+                         cfg.overlay({'data.path': '/tmp'}).fingerprint('data'))
+        self.assertEqual(cfg.fingerprint(['data', 'training']),
+                         cfg.fingerprint(['training', 'data']))
+
+    def test_unset_params_ignored(self):
+        cfg = get_current_config()
+        first = cfg.fingerprint()
+        Section('other').params(value=Param(int))
+        self.assertEqual(cfg.fingerprint(), first)
+        Section('other2').params(value=Param(int, default=1))
+        self.assertNotEqual(cfg.fingerprint(), first)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_arrays(self):
+        cfg = get_current_config()
+        cfg.collect({'data.weights': np.arange(4, dtype='float32')})
+        first = cfg.fingerprint()
+        cfg.collect({'data.weights': np.arange(4, dtype='float32')})
+        self.assertEqual(cfg.fingerprint(), first)
+        cfg.collect({'data.weights': np.arange(4, dtype='float64')})
+        self.assertNotEqual(cfg.fingerprint(), first)
+        cfg.collect({'data.weights': np.arange(4, dtype='float32').reshape(2, 2)})
+        self.assertNotEqual(cfg.fingerprint(), first)
+
+    def test_encoding(self):
+        self.assertEqual(encoded({'a': 1, 'b': 2}), encoded({'b': 2, 'a': 1}))
+        self.assertNotEqual(encoded([1]), encoded((1,)))
+        self.assertNotEqual(encoded(1), encoded(1.0))
+        self.assertNotEqual(encoded(1), encoded(True))
+        self.assertNotEqual(encoded(['ab', 'c']), encoded(['a', 'bc']))
+        with self.assertRaises(TypeError):
+            encoded(object())
+
+    def test_lazy_imports(self):
+        sys.modules.pop('fractions', None)
+        Section('lazy').params(module=Param(Module(lazy=True)))
+        cfg = get_current_config().collect({'lazy.module': 'fractions'})
+        lazy = cfg.fingerprint('lazy')
+        self.assertNotIn('fractions', sys.modules)
+
+        Section('eager').params(module=Param(Module()))
+        cfg.collect({'eager.module': 'fractions'})
+        self.assertEqual(encoded(cfg['lazy.module']), encoded(cfg['eager.module']))
+        self.assertEqual(len(lazy), 64)
+
+    def test_incremental(self):
+        index = FingerprintIndex()
+        index.update(('a', 'b'), 1)
+        index.update(('a', 'c'), 2)
+        index.update(('d',), 3)
+        total = index.sums[()]
+        index.update(('a', 'b'), 5)
+        index.update(('a', 'b'), 1)
+        self.assertEqual(index.sums[()], total)
+        index.update(('a', 'b'), None)
+        index.update(('a', 'c'), None)
+        self.assertEqual(index.sums[('a',)], 0)
+
+    def test_missing_values(self):
+        Section('req').params(value=Param(int, required=True))
+        cfg = get_current_config()
+        with self.assertRaises(MissingValueError):
+            cfg.fingerprint()
+        with self.assertRaises(MissingValueError):
+            cfg.fingerprint()
+        # Other subtrees don't need the missing value
+        self.assertEqual(cfg.fingerprint('training'),
+                         cfg.overlay({'req.value': 1}).fingerprint('training'))
+        cfg.collect({'req.value': 1})
+        self.assertEqual(len(cfg.fingerprint()), 64)
+
+    def test_overlay(self):
+        cfg = get_current_config()
+        child = cfg.overlay({'training.lr': 0.5})
+        self.assertNotEqual(child.fingerprint(), cfg.fingerprint())
+        self.assertEqual(child.fingerprint('data'), cfg.fingerprint('data'))
+        self.assertEqual(cfg.overlay({'training.lr': 0.1}).fingerprint(),
+                         cfg.fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
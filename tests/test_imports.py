@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+import unittest
+from os import path
+
+ROOT = path.dirname(path.dirname(path.realpath(__file__)))
+
+HEAVY_MODULES = ['argparse', 'json', 'terminaltables', 'yaml']
+
+def loaded_modules(code):
+    script = "import sys\n" + code + """
+import json
+print(json.dumps(sorted(sys.modules)))
+"""
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return set(json.loads(output.stdout.splitlines()[-1]))
+
+
+class TestImports(unittest.TestCase):
+
+    def test_import_is_light(self):
+        modules = loaded_modules("""
+import fastargs
+loaded = [m for m in %r if m in sys.modules]
+assert not loaded, loaded
+""" % (HEAVY_MODULES,))
+        self.assertIn('fastargs', modules)
+        self.assertNotIn('fastargs.config', modules)
+
+    def test_reading_config_is_light(self):
+        loaded_modules("""
+from fastargs import Section, Param, get_current_config
+from fastargs.decorators import param
+
+Section('a').params(b=Param(int, default=3))
+get_current_config().collect({'a.b': 4})
+
+@param('a.b')
+def read(b):
+    return b
+
+assert read() == 4
+loaded = [m for m in %r if m in sys.modules]
+assert not loaded, loaded
+""" % (HEAVY_MODULES,))
+
+    def test_lazy_attributes(self):
+        import fastargs
+        from fastargs.config import Config
+        self.assertIs(fastargs.Config, Config)
+        self.assertIn('Config', dir(fastargs))
+        with self.assertRaises(AttributeError):
+            fastargs.does_not_exist
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import io
+import pickle
 
 from fastargs import Config, set_current_config, get_current_config, Section, Param
 from fastargs.validation import Anything
@@ -140,6 +141,211 @@ class TestStringMethods(unittest.TestCase):
         self.assertNotIn('d', all_config)
         self.assertNotIn('c', all_config)
 
+    def test_values_cached_until_collect(self):
+        calls = []
+
+        class Counting(Anything):
+            def check(self, value):
+                calls.append(value)
+                return value
+
+        Section('cached').params(
+            value=Param(Counting())
+        )
+
+        cfg = get_current_config().collect({'cached.value': 1})
+        calls.clear()
+        self.assertEqual(cfg['cached.value'], 1)
+        self.assertEqual(cfg['cached.value'], 1)
+        self.assertEqual(cfg[('cached', 'value')], 1)
+        self.assertEqual(len(calls), 1)
+
+        cfg.collect({'cached.value': 2})
+        self.assertEqual(cfg['cached.value'], 2)
+
+    def test_collect_while_resolving(self):
+        # Another thread collects while the old value is being checked
+        class Racing(Anything):
+            def check(self, value):
+                if value == 1:
+                    cfg.collect({'cached.value': 2})
+                return value
+
+        Section('cached').params(
+            value=Param(Racing())
+        )
+
+        cfg = get_current_config()
+        cfg.content[('cached', 'value')] = 1
+        self.assertEqual(cfg['cached.value'], 1)
+        self.assertEqual(cfg['cached.value'], 2)
+
+        cfg.content[('cached', 'value')] = 1
+        cfg.invalidate()
+        self.assertEqual(cfg.validate(mode='errordict'), {})
+        self.assertEqual(cfg['cached.value'], 2)
+
+    def test_enable_if_invalidates_cache(self):
+        section = Section('cond').params(
+            value=Param(int, default=3)
+        )
+
+        cfg = get_current_config()
+        self.assertEqual(cfg['cond.value'], 3)
+        section.enable_if(lambda cfg: False)
+        self.assertIsNone(cfg['cond.value'])
+
+    def test_conditions_cached_until_dependencies_change(self):
+        calls = []
+
+        def condition(cfg):
+            calls.append(1)
+            return cfg['a.value'] > 0
+
+        Section('a').params(value=Param(int), other=Param(int))
+        Section('b').enable_if(condition).params(value=Param(int, default=1))
+        Section('c').enable_if(lambda cfg: cfg['b.value'] == 1).params(
+            value=Param(int, default=2)
+        )
+
+        cfg = get_current_config().collect({'a.value': 1})
+        self.assertEqual(cfg['c.value'], 2)
+        cfg.collect({'a.other': 5})
+        self.assertEqual(cfg['b.value'], 1)
+        self.assertEqual(cfg['c.value'], 2)
+        self.assertEqual(len(calls), 1)
+
+        # c depends on a.value through b
+        cfg.collect({'a.value': -1})
+        self.assertIsNone(cfg['b.value'])
+        self.assertIsNone(cfg['c.value'])
+        self.assertEqual(len(calls), 2)
+
+    def test_cyclic_conditions(self):
+        from fastargs.exceptions import CyclicConditionError
+
+        Section('a').enable_if(lambda cfg: cfg['b.value'] == 1).params(
+            value=Param(int, default=1)
+        )
+        Section('b').enable_if(lambda cfg: cfg['a.value'] == 1).params(
+            value=Param(int, default=1)
+        )
+
+        with self.assertRaises(CyclicConditionError) as context:
+            get_current_config()['a.value']
+        self.assertIn('a -> b -> a', str(context.exception))
+
+    def test_freeze(self):
+        Section('first.sec').params(
+            param=Param(Anything()),
+            other=Param(int, default=3),
+            notdef=Param(Anything())
+        )
+
+        cfg = get_current_config().collect({'first.sec.param': [1, 2]})
+        frozen = cfg.freeze()
+        cfg.collect({'first.sec.param': 'changed'})
+
+        self.assertEqual(frozen.first.sec.param, (1, 2))
+        self.assertEqual(frozen['first.sec.other'], 3)
+        self.assertEqual(frozen[('first', 'sec', 'other')], 3)
+        self.assertEqual(frozen['first'].sec['other'], 3)
+        self.assertNotIn('first.sec.notdef', frozen)
+        self.assertEqual(frozen._to_dict(),
+                         {'first': {'sec': {'param': (1, 2), 'other': 3}}})
+
+        with self.assertRaises(AttributeError):
+            frozen.first = 2
+        with self.assertRaises(KeyError):
+            frozen['first.sec.notdef']
+
+        cfg.collect({'first.sec.param': [1, 2]})
+        self.assertEqual(hash(frozen), hash(cfg.freeze()))
+        self.assertEqual(frozen, cfg.freeze())
+        self.assertEqual(pickle.loads(pickle.dumps(frozen.first)), frozen.first)
+
+    def test_freeze_copies_values(self):
+        Section('a').params(
+            x=Param(Anything()),
+        )
+        cfg = get_current_config().collect({'a.x': [1, {'b': [2]}]})
+        frozen = cfg.freeze()
+        cfg['a.x'].append(3)
+        cfg['a.x'][1]['b'].append(4)
+
+        self.assertEqual(frozen.a.x, (1, {'b': (2,)}))
+        with self.assertRaises(TypeError):
+            frozen.a.x[1]['c'] = 5
+        fresh = cfg.freeze()
+        self.assertNotEqual(frozen, fresh)
+        cfg.collect({'a.x': [1, {'b': [2]}]})
+        self.assertEqual(frozen, cfg.freeze())
+        self.assertEqual(hash(frozen), hash(cfg.freeze()))
+
+    def test_freeze_attributes(self):
+        Section('a.b').params(
+            x=Param(int, default=1),
+            _items=Param(int, default=2),
+        )
+        frozen = get_current_config().freeze()
+        self.assertEqual(frozen.a.b.x, 1)
+        self.assertEqual(frozen.a.b._items, 2)
+        self.assertEqual(frozen.a['b.x'], 1)
+        self.assertEqual(frozen[['a', 'b', 'x']], 1)
+        self.assertEqual(dict(frozen._items()),
+                         {('a', 'b', 'x'): 1, ('a', 'b', '_items'): 2})
+        with self.assertRaises(AttributeError):
+            frozen.a.nope
+        with self.assertRaises(AttributeError):
+            frozen.a.x = 2
+
+    def test_freeze_names_and_modules(self):
+        from fastargs.validation import Module
+        Section('data').params(
+            items=Param(int, default=1),
+            to_dict=Param(int, default=2),
+            module=Param(Module(), default='json'),
+        )
+        frozen = get_current_config().freeze()
+        self.assertEqual(frozen.data.items, 1)
+        self.assertEqual(frozen.data.to_dict, 2)
+
+        restored = pickle.loads(pickle.dumps(frozen))
+        self.assertIs(restored.data.module, frozen.data.module)
+        self.assertEqual(restored, frozen)
+
+    def test_entries_declared_during_collect(self):
+        calls = []
+
+        class Declaring(Anything):
+            def check(self, value):
+                calls.append(value)
+                Section(value).params(
+                    param=Param(Counting())
+                )
+                return value
+
+        class Counting(Anything):
+            def check(self, value):
+                calls.append(value)
+                return value
+
+        Section('plugin').params(
+            first=Param(Declaring()),
+            second=Param(Declaring()),
+        )
+
+        cfg = get_current_config().collect({
+            'plugin.first': 'a',
+            'plugin.second': 'b',
+            'a.param': 1,
+            'b.param': 2,
+        })
+
+        self.assertEqual(sorted(calls, key=str), [1, 2, 'a', 'b'])
+        self.assertEqual(cfg['a.param'], 1)
+        self.assertEqual(cfg['b.param'], 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,7 @@
+from fastargs import Section, Param, get_current_config
+
+Section('plugin').params(
+    x=Param(int, default=1)
+)
+
+get_current_config().collect({'plugin.x': 5})
@@ -0,0 +1,5 @@
+from fastargs import Section, Param
+
+Section('plugin2').params(
+    x=Param(int, default=1)
+)
@@ -0,0 +1,104 @@
+import gc
+import pickle
+import sys
+import unittest
+from os import path
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.decorators import param
+from fastargs.validation import Anything, Module
+
+sys.path.append(path.dirname(path.realpath(__file__)))
+
+
+@param('a.value')
+@param('a.other')
+def read(value, other):
+    return value, other
+
+
+class TestOverlay(unittest.TestCase):
+    def setUp(self):
+        set_current_config(Config())
+        Section('a').params(
+            value=Param(int, default=1),
+            other=Param(int, default=2),
+        )
+        Section('b').enable_if(lambda cfg: cfg['a.value'] > 5).params(
+            value=Param(Anything(), default='b')
+        )
+
+    def test_overrides(self):
+        cfg = get_current_config().collect({'a.other': 3})
+        child = cfg.overlay({'a.value': '7'})
+        self.assertEqual(child['a.value'], 7)
+        self.assertEqual(child['a.other'], 3)
+        self.assertEqual(child[('a', 'value')], 7)
+        self.assertEqual(cfg['a.value'], 1)
+        self.assertEqual(vars(child.get().a), {'value': 7, 'other': 3})
+        self.assertEqual(dict(child.overrides), {('a', 'value'): '7'})
+
+    def test_sections_enabled_in_overlay(self):
+        cfg = get_current_config()
+        child = cfg.overlay({'a.value': 10})
+        self.assertEqual(child['b.value'], 'b')
+        self.assertIsNone(cfg['b.value'])
+
+    def test_follows_parent(self):
+        cfg = get_current_config()
+        child = cfg.overlay({'a.value': 10})
+        self.assertEqual(child['a.other'], 2)
+        cfg.collect({'a.other': 4, 'a.value': 3})
+        self.assertEqual(child['a.other'], 4)
+        self.assertEqual(child['a.value'], 10)
+
+        Section('c').params(value=Param(int, default=5))
+        self.assertEqual(child['c.value'], 5)
+
+    def test_nested_overlays(self):
+        cfg = get_current_config()
+        child = cfg.overlay({'a.value': 10})
+        grandchild = child.overlay({'a.other': 20})
+        self.assertEqual(read(), (1, 2))
+        with grandchild.scoped():
+            self.assertEqual(read(), (10, 20))
+            cfg.collect({'a.value': 3, 'a.other': 4})
+            self.assertEqual(read(), (10, 20))
+            child.collect({'a.value': 11})
+            self.assertEqual(read(), (11, 20))
+        self.assertEqual(read(), (3, 4))
+
+    def test_collect_only_writes_overlay(self):
+        cfg = get_current_config()
+        child = cfg.overlay()
+        child.collect({'a.value': 8})
+        self.assertEqual(child['a.value'], 8)
+        self.assertEqual(child['b.value'], 'b')
+        self.assertEqual(cfg['a.value'], 1)
+        self.assertNotIn(('a', 'value'), cfg.content)
+
+    def test_collect_entries_declared_by_imports(self):
+        Section('m').params(module=Param(Module()))
+        cfg = get_current_config()
+        child = cfg.overlay()
+        child.collect({'m.module': 'test_module.with_default', 'plugin2.x': 7})
+        self.assertEqual(child['plugin2.x'], 7)
+        self.assertEqual(cfg['plugin2.x'], 1)
+        sys.modules.pop('test_module.with_default')
+
+    def test_dropped_overlays(self):
+        cfg = get_current_config()
+        for i in range(10):
+            cfg.overlay({'a.value': i})['a.value']
+        gc.collect()
+        self.assertEqual(len(cfg.overlays), 0)
+
+    def test_pickle(self):
+        child = get_current_config().overlay({'a.value': 9})
+        restored = pickle.loads(pickle.dumps(child))
+        self.assertEqual(restored['a.value'], 9)
+        self.assertEqual(restored['b.value'], 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import unittest
+from os import path
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.exceptions import MissingValueError, ValidationError
+from fastargs.validation import Checker, Int
+
+sys.path.append(path.dirname(path.realpath(__file__)))
+
+
+class Slow(Checker):
+    def check(self, value):
+        time.sleep(0.2)
+        return int(value)
+
+    def help(self):
+        return 'slow int'
+
+
+class Remote(Checker):
+    process_safe = True
+
+    def check(self, value):
+        if value == 'bad':
+            raise ValueError()
+        return (int(value), os.getpid())
+
+    def help(self):
+        return 'remote int'
+
+
+class Declaring(Checker):
+    # Like the imports of Module, checking declares params
+    def check(self, value):
+        Section(value).params(p=Param(int, default=1))
+        return value
+
+    def help(self):
+        return 'section name'
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        set_current_config(Config())
+
+    def declare(self):
+        Section('slow').params(**{
+            f'p{i}': Param(Slow(), default=i) for i in range(5)
+        })
+        Section('other').params(
+            missing=Param(Int(), required=True),
+            wrong=Param(Int()),
+            remote=Param(Remote(), default='3'),
+            remote_bad=Param(Remote()),
+        )
+
+    def test_same_results(self):
+        self.declare()
+        sequential = get_current_config().collect({
+            'other.wrong': 'x', 'other.remote_bad': 'bad'
+        })
+        start = time.perf_counter()
+        errors = sequential.validate(mode='errordict')
+        sequential_time = time.perf_counter() - start
+
+        set_current_config(Config())
+        self.declare()
+        parallel = get_current_config().collect({
+            'other.wrong': 'x', 'other.remote_bad': 'bad'
+        })
+        start = time.perf_counter()
+        parallel_errors = parallel.validate(mode='errordict', parallel=8)
+        parallel_time = time.perf_counter() - start
+
+        self.assertEqual(list(errors), list(parallel_errors))
+        self.assertEqual([type(e) for e in errors.values()],
+                         [type(e) for e in parallel_errors.values()])
+        self.assertEqual([str(e) for e in errors.values()],
+                         [str(e) for e in parallel_errors.values()])
+        self.assertIsInstance(parallel_errors[('other', 'missing')], MissingValueError)
+        self.assertIsInstance(parallel_errors[('other', 'remote_bad')], ValidationError)
+
+        for i in range(5):
+            self.assertEqual(parallel[f'slow.p{i}'], i)
+        value, pid = parallel[('other', 'remote')]
+        self.assertEqual(value, 3)
+        self.assertNotEqual(pid, os.getpid())
+        self.assertLess(parallel_time, sequential_time / 2)
+
+    def test_scoped_declarations(self):
+        cfg = Config()
+        with cfg.scoped():
+            Section('a').params(**{
+                f'p{i}': Param(Declaring(), default=f'declared{i}')
+                for i in range(3)
+            })
+            errors = cfg.validate(mode='errordict', parallel=4)
+
+        self.assertEqual(errors, {})
+        for i in range(3):
+            self.assertEqual(cfg[f'declared{i}.p'], 1)
+            self.assertNotIn((f'declared{i}', 'p'), get_current_config().entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import unittest
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.decorators import param
+from fastargs.profiling import Profiler, profile, json_sink
+
+
+@param('a.value')
+def read(value):
+    return value
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        set_current_config(Config())
+        Section('a').params(value=Param(int, default=1), other=Param(int))
+
+    def test_accesses_and_validation(self):
+        cfg = get_current_config()
+        with cfg.profile() as profiler:
+            self.assertEqual(type(cfg).__name__, 'ProfiledConfig')
+            cfg['a.value']
+            cfg['a.value']
+            cfg[('a', 'value')]
+            cfg['a.other']
+        self.assertIs(type(cfg), Config)
+        self.assertIsNone(cfg.profiler)
+
+        report = profiler.report()
+        self.assertEqual(report['accesses'], {'a.value': 3, 'a.other': 1})
+        self.assertEqual(set(report['validation']), {'a.value', 'a.other'})
+
+        cfg['a.value']
+        self.assertEqual(profiler.report()['accesses']['a.value'], 3)
+
+    def test_nested(self):
+        cfg = get_current_config()
+        with cfg.profile() as outer:
+            cfg['a.value']
+            with cfg.profile() as inner:
+                cfg['a.other']
+            self.assertIs(cfg.profiler, outer)
+            cfg['a.value']
+        self.assertIs(type(cfg), Config)
+        self.assertIsNone(cfg.profiler)
+        self.assertEqual(outer.report()['accesses'], {'a.value': 2})
+        self.assertEqual(inner.report()['accesses'], {'a.other': 1})
+
+        first, second = Profiler(), Profiler()
+        first.attach(cfg)
+        second.attach(cfg)
+        with self.assertRaises(RuntimeError):
+            first.detach(cfg)
+        second.detach(cfg)
+        first.detach(cfg)
+        self.assertIs(type(cfg), Config)
+
+    def test_sources(self):
+        folder = tempfile.TemporaryDirectory()
+        fname = os.path.join(folder.name, 'config.json')
+        with open(fname, 'w') as handle:
+            json.dump({'a': {'value': 3}}, handle)
+
+        cfg = get_current_config()
+        with profile() as profiler:
+            cfg.collect_json(fname)
+            cfg.collect_env_variables()
+        folder.cleanup()
+
+        sources = profiler.report()['sources']
+        self.assertEqual(sources['json']['calls'], 1)
+        self.assertEqual(sources['env']['calls'], 1)
+        self.assertGreaterEqual(sources['collect']['calls'], 1)
+        self.assertGreaterEqual(sources['json']['seconds'], 0)
+
+    def test_functions(self):
+        with profile() as profiler:
+            self.assertEqual(read(), 1)
+            read()
+        functions = profiler.report()['functions']
+        name = f'{__name__}.read'
+        self.assertEqual(functions[name]['calls'], 1)
+
+    def test_sinks(self):
+        reports = []
+        folder = tempfile.TemporaryDirectory()
+        fname = os.path.join(folder.name, 'profile.json')
+        with profile(sinks=[reports.append, json_sink(fname)]):
+            get_current_config()['a.value']
+        with open(fname) as handle:
+            self.assertEqual(json.load(handle), reports[0])
+        folder.cleanup()
+        self.assertEqual(reports[0]['accesses'], {'a.value': 1})
+
+    def test_compiled_and_overlay(self):
+        cfg = get_current_config()
+        for config in [cfg.compile(), cfg.overlay({'a.value': 2})]:
+            base = type(config)
+            profiler = Profiler().attach(config)
+            self.assertIs(type(config).__bases__[1], base)
+            config['a.value']
+            profiler.detach(config)
+            self.assertIs(type(config), base)
+
+
+if __name__ == '__main__':
+    unittest.main()
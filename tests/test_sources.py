@@ -1,6 +1,6 @@
 import argparse
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 import tempfile
 import sys
 from os import path
@@ -15,6 +15,7 @@ from fastargs import (Config, set_current_config, get_current_config, Section,
 from fastargs.validation import (Anything, Str, Int, Float, And, Or, InRange,
                                  Module)
 from fastargs.exceptions import MissingValueError, ValidationError
+from fastargs import loaders
 
 sys.path.append(path.dirname(path.realpath(__file__)))
 
@@ -41,6 +42,32 @@ class TestSources(unittest.TestCase):
         cfg.collect_env_variables()
         self.assertEqual(cfg['envtest.v1'], 18)
 
+    def test_env_vars_prefix(self):
+        Section('envtest.sub').params(
+            v1=Param(int),
+            v2=Param(int, default=2)
+        )
+
+        os.environ['envtest.sub.v1'] = "3"
+        os.environ['FASTARGS_ENVTEST__SUB__V1'] = "17"
+        cfg = get_current_config().collect_env_variables('FASTARGS_')
+        self.assertEqual(cfg['envtest.sub.v1'], 17)
+        self.assertEqual(cfg['envtest.sub.v2'], 2)
+
+    def test_env_vars_declared_by_module(self):
+        Section('module.import').params(
+            module=Param(Module(), required=True)
+        )
+
+        os.environ['module.import.module'] = 'test_module.with_params'
+        os.environ['imported_section.blah.p1'] = '4.5'
+        cfg = get_current_config().collect_env_variables()
+        del os.environ['module.import.module']
+        del os.environ['imported_section.blah.p1']
+
+        self.assertEqual(cfg['imported_section.blah.p1'], 4.5)
+        sys.modules.pop('test_module.with_params')
+
     def test_json(self, assume_known=True):
         Section('test.json').params(
             p1=Param(float),
@@ -103,6 +130,106 @@ class TestSources(unittest.TestCase):
         self.setUp()
         self.test_json(assume_known=False)
 
+    def test_format_detection(self):
+        Section('test.format').params(
+            p1=Param(float),
+            p2=Param(float)
+        )
+
+        cfg = get_current_config()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # YAML flow mapping that is not valid JSON
+            path = os.path.join(tmp, 'something')
+            with open(path, 'w') as handle:
+                handle.write('{test.format.p1: 3}')
+            cfg.collect_config_file(path)
+            self.assertEqual(cfg['test.format.p1'], 3)
+
+            path = os.path.join(tmp, 'config.yml')
+            with open(path, 'w') as handle:
+                handle.write('test:\n  format:\n    p2: 4\n')
+            parse_json = Mock(side_effect=loaders.parse_json)
+            with patch.dict(loaders.LOADERS,
+                            {'.json': loaders.Loader('json', parse_json)}):
+                cfg.collect_config_file(path)
+            parse_json.assert_not_called()
+            self.assertEqual(cfg['test.format.p2'], 4)
+
+        self.assertEqual(cfg.loaded_files[0][1], 'yaml.CSafeLoader'
+                         if hasattr(yaml, 'CSafeLoader') else 'yaml.SafeLoader')
+        self.assertEqual(cfg.loaded_files[1], (path, cfg.loaded_files[0][1]))
+
+    def test_custom_loader(self):
+        Section('test.custom').params(
+            p1=Param(int),
+        )
+
+        def parse_ini(text):
+            return dict(line.split('=') for line in text.splitlines())
+
+        cfg = get_current_config()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.INI')
+            with open(path, 'w') as handle:
+                handle.write('test.custom.p1=5')
+            with patch.dict(loaders.LOADERS):
+                loaders.register_loader('.ini', parse_ini, 'ini')
+                cfg.collect_config_file(path)
+
+        self.assertEqual(cfg['test.custom.p1'], 5)
+        self.assertEqual(cfg.loaded_files, [(path, 'ini')])
+
+    def test_file_cache(self):
+        Section('test.cache').params(
+            p1=Param(float),
+        )
+
+        cfg = get_current_config()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.yaml')
+            with open(path, 'w') as handle:
+                handle.write('test.cache.p1: 1')
+            stat = os.stat(path)
+
+            with patch.dict(os.environ, {'FASTARGS_CACHE_DIR': tmp + '/cache'}):
+                cfg.collect_config_file(path)
+                self.assertEqual(cfg['test.cache.p1'], 1)
+
+                # Same path, size and mtime: the cached content is used
+                with open(path, 'w') as handle:
+                    handle.write('test.cache.p1: 2')
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                cfg.collect_config_file(path)
+                self.assertEqual(cfg['test.cache.p1'], 1)
+
+                # Without cache the file is parsed again
+                cfg.collect_config_file(path, cache=False)
+                self.assertEqual(cfg['test.cache.p1'], 2)
+
+                # Another parser for the extension doesn't reuse the cache
+                with patch.dict(loaders.LOADERS):
+                    loaders.register_loader('.yaml', lambda text: {'test.cache.p1': 3},
+                                            name='other')
+                    cfg.collect_config_file(path)
+                    self.assertEqual(cfg['test.cache.p1'], 3)
+
+                cached = loaders.cache_path(path)
+                with open(cached) as handle:
+                    self.assertEqual(json.load(handle), [[['test', 'cache', 'p1'], 1]])
+
+                # Files of other users are ignored
+                if os.getuid() == 0:
+                    os.chown(cached, 12345, 12345)
+                    cfg.collect_config_file(path)
+                    self.assertEqual(cfg['test.cache.p1'], 2)
+
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                cfg.collect_config_file(path)
+                self.assertEqual(cfg['test.cache.p1'], 2)
+
     def test_priority(self):
         Section('prio').params(
             p1=Param(float),
@@ -180,9 +307,9 @@ class TestSources(unittest.TestCase):
         self.assertEqual(cfg['sec2.titi.p1'], 2)
         self.assertEqual(cfg['sec2.titi.p2'], 3)
 
-        self.assertIn('sec1.test.p1', parser.epilog)
-        self.assertIn('mydesc1', parser.epilog)
-        self.assertIn('mydesc2', parser.epilog)
+        self.assertIn('sec1.test.p1', parser.format_help())
+        self.assertIn('mydesc1', parser.format_help())
+        self.assertIn('mydesc2', parser.format_help())
 
     def test_modules_visible_in_help(self):
         Section('module.import').params(
@@ -195,7 +322,7 @@ class TestSources(unittest.TestCase):
         with patch('sys.argv', ['pp', '--module.import.module=test_module.with_params']):
             cfg.augment_argparse(parser)
 
-        self.assertIn('imported_section.blah.p1', parser.epilog)
+        self.assertIn('imported_section.blah.p1', parser.format_help())
         sys.modules.pop('test_module.with_params')
 
     def test_conditional_arguments_properly_hidden(self):
@@ -218,8 +345,8 @@ class TestSources(unittest.TestCase):
             cfg.augment_argparse(parser)
             cfg.collect_argparse_args(parser)
 
-        self.assertIn('showsec', parser.epilog)
-        self.assertNotIn('hidesec', parser.epilog)
+        self.assertIn('showsec', parser.format_help())
+        self.assertNotIn('hidesec', parser.format_help())
 
     def test_help_flag_passed(self):
         Section('a').params(
@@ -242,10 +369,30 @@ class TestSources(unittest.TestCase):
                 with patch('sys.stdout', fakeio):
                     cfg.augment_argparse(parser)
                     self.assertFalse(data['called'])
-                    self.assertIn('a.value', parser.epilog)
+                    self.assertIn('a.value', parser.format_help())
                     cfg.collect_argparse_args(parser)
                     self.assertTrue(data['called'])
 
+    def test_help_rendered_lazily(self):
+        Section('a', 'lazy section').params(
+            value=Param(int, 'lazy value')
+        )
+
+        cfg = get_current_config()
+        parser = argparse.ArgumentParser(description='Test lib')
+        with patch('sys.argv', ['pp']):
+            cfg.augment_argparse(parser)
+
+        tables = parser.formatter_class.keywords['tables']
+        self.assertIsNone(tables.rendered)
+        help_text = parser.format_help()
+        self.assertIsNone(parser.epilog)
+        parser.epilog = 'Some epilog'
+        parser.epilog += ' of the program'
+        self.assertIn('Some epilog of the program', parser.format_help())
+        self.assertIn('lazy section', help_text)
+        self.assertIn('lazy value', help_text)
+
     def test_flag(self):
         Section('a').params(
             a=Param(bool, is_flag=True),
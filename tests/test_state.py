@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import unittest
+
+from fastargs import (Config, set_current_config, get_current_config,
+                      use_config, Section, Param)
+from fastargs.decorators import param
+
+
+def make_config(value):
+    cfg = Config()
+    Section('a', config_descriptor=cfg).params(value=Param(int))
+    return cfg.collect({'a.value': value})
+
+
+@param('a.value')
+def read(value):
+    return value
+
+
+class TestState(unittest.TestCase):
+    def setUp(self):
+        set_current_config(make_config(0))
+
+    def test_use_config(self):
+        default = get_current_config()
+        scoped = make_config(1)
+        with use_config(scoped) as cfg:
+            self.assertIs(cfg, scoped)
+            self.assertIs(get_current_config(), scoped)
+            self.assertEqual(read(), 1)
+            with make_config(2).scoped():
+                self.assertEqual(read(), 2)
+            self.assertEqual(read(), 1)
+        self.assertIs(get_current_config(), default)
+        self.assertEqual(read(), 0)
+
+    def test_set_inside_scope(self):
+        default = get_current_config()
+        with use_config(make_config(1)):
+            other = make_config(2)
+            set_current_config(other)
+            self.assertIs(get_current_config(), other)
+        self.assertIs(get_current_config(), default)
+
+    def test_threads(self):
+        results = {}
+        barrier = threading.Barrier(8)
+
+        def worker(i):
+            with make_config(i).scoped():
+                barrier.wait()
+                results[i] = [read() for _ in range(100)]
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i in range(8):
+            self.assertEqual(results[i], [i] * 100)
+        self.assertEqual(read(), 0)
+
+    def test_asyncio_tasks(self):
+        async def handle(i):
+            with make_config(i).scoped():
+                await asyncio.sleep(0)
+                return read()
+
+        async def main():
+            return await asyncio.gather(*(handle(i) for i in range(10)))
+
+        self.assertEqual(asyncio.run(main()), list(range(10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
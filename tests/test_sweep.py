@@ -0,0 +1,96 @@
+import unittest
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.decorators import param
+from fastargs.exceptions import ValidationError
+from fastargs.sweep import grid, zipped, random_search
+from fastargs.validation import Anything
+
+
+class Counting(Anything):
+    def __init__(self):
+        self.calls = []
+
+    def check(self, value):
+        self.calls.append(value)
+        return float(value)
+
+
+@param('training.lr')
+@param('training.bs')
+def train(lr, bs):
+    return lr, bs
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        set_current_config(Config())
+        self.checker = Counting()
+        Section('training').params(
+            lr=Param(self.checker, default=0.1),
+            bs=Param(int, default=32),
+            epochs=Param(int, default=10),
+        )
+
+    def test_grid(self):
+        cfg = get_current_config()
+        trials = grid({'training.lr': ['0.1', '0.01'], 'training.bs': [64, 128, 256]})
+        self.assertEqual(cfg.overlays, None)
+
+        points = []
+        for trial in trials:
+            points.append((trial['training.lr'], trial['training.bs']))
+            self.assertEqual(trial['training.epochs'], 10)
+        self.assertEqual(points, [(lr, bs) for lr in [0.1, 0.01]
+                                  for bs in [64, 128, 256]])
+        # Once per distinct value, not per trial
+        self.assertEqual(self.checker.calls, ['0.1', '0.01'])
+        # The base is untouched
+        self.assertEqual(cfg['training.bs'], 32)
+
+    def test_trials_with_decorators(self):
+        results = []
+        for trial in grid({'training.bs': [1, 2]}):
+            with trial.scoped():
+                results.append(train())
+        self.assertEqual(results, [(0.1, 1), (0.1, 2)])
+
+    def test_zipped(self):
+        trials = list(zipped({'training.lr': [1, 2], 'training.bs': [3, 4]}))
+        self.assertEqual([t.get().training.bs for t in trials], [3, 4])
+        self.assertEqual([t['training.lr'] for t in trials], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            list(zipped({'training.lr': [1, 2], 'training.bs': [3]}))
+
+    def test_random_search(self):
+        spec = {
+            'training.lr': lambda rng: rng.choice([1, 2]),
+            'training.bs': [16, 32],
+        }
+        trials = list(random_search(spec, 50, seed=0))
+        self.assertEqual(len(trials), 50)
+        self.assertTrue({t['training.bs'] for t in trials} <= {16, 32})
+        self.assertTrue({t['training.lr'] for t in trials} <= {1.0, 2.0})
+        self.assertLessEqual(len(self.checker.calls), 2)
+
+        again = [t['training.lr'] for t in random_search(spec, 50, seed=0)]
+        self.assertEqual(again, [t['training.lr'] for t in trials])
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValidationError) as context:
+            next(grid({'training.bs': [1, 'x']}))
+        self.assertIn('training.bs', str(context.exception))
+        with self.assertRaises(KeyError):
+            next(grid({'training.nope': [1]}))
+
+    def test_conditional_sections(self):
+        Section('adam').enable_if(lambda cfg: cfg['training.bs'] > 100).params(
+            beta=Param(float, default=0.9)
+        )
+        values = [t['adam.beta'] for t in grid({'training.bs': [10, 1000]})]
+        self.assertEqual(values, [None, 0.9])
+        self.assertIsNone(get_current_config()['adam.beta'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,22 @@
 import unittest
+import importlib
 import io
+import pickle
 from os import path
 import sys
 from unittest.mock import patch
 
 from fastargs import Config, set_current_config, get_current_config, Section, Param
-from fastargs.validation import (Anything, Str, Int, Float, And, Or, InRange,
-                                 Module, ImportedObject, OneOf)
+from fastargs.validation import (Anything, Str, Int, Float, Bool, And, Or,
+                                 InRange, Module, ImportedObject, OneOf,
+                                 ListOf, ArrayOf)
 from fastargs.exceptions import MissingValueError, ValidationError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 sys.path.append(path.dirname(path.realpath(__file__)))
 
 class TestValidation(unittest.TestCase):
@@ -46,6 +54,26 @@ class TestValidation(unittest.TestCase):
         self.assertIsNone(cfg['sec.noreq'])
 
 
+    def test_shared_checker_validated_together(self):
+        checker = Int()
+        Section('sec').params(**{
+            'ok': Param(checker, default=1),
+            'str': Param(checker),
+            'bad': Param(checker),
+            'missing': Param(checker, required=True),
+            'unset': Param(checker),
+        })
+
+        cfg = get_current_config().collect({'sec.str': '3', 'sec.bad': 'x'})
+        errors = cfg.validate(mode='errordict')
+        self.assertEqual(list(errors), [('sec', 'bad'), ('sec', 'missing')])
+        self.assertEqual(str(errors[('sec', 'bad')]),
+                         'value `x` does not fit checker for `an int`')
+        self.assertIsInstance(errors[('sec', 'missing')], MissingValueError)
+        self.assertEqual(cfg[('sec', 'ok')], 1)
+        self.assertEqual(cfg[('sec', 'str')], 3)
+        self.assertIsNone(cfg[('sec', 'unset')])
+
     def test_default(self):
         Section('sec').params(
             noreq=Param(Int(), 'non required param', default=8, required=False)
@@ -245,6 +273,22 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(cfg['imported_section.blah.p1'], 42.5)
         sys.modules.pop('test_module.with_params')
 
+    def test_imported_module_collecting(self):
+        Section('a').params(
+            m=Param(Module()),
+            z=Param(int)
+        )
+
+        cfg = get_current_config().collect({
+            'a.m': 'test_module.collects',
+            'a.z': 3,
+            'plugin.x': 7
+        })
+
+        self.assertEqual(cfg['a.z'], 3)
+        self.assertEqual(cfg['plugin.x'], 7)
+        sys.modules.pop('test_module.collects')
+
     def test_imported_object(self):
         Section('module.import').params(
             obj=Param(ImportedObject(), required=True)
@@ -259,6 +303,45 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(loaded_function(), 42)
         sys.modules.pop('test_module.file1')
 
+    def test_imports_memoized(self):
+        Section('module.import').params(
+            module=Param(Module(), required=True),
+            obj=Param(ImportedObject(), required=True)
+        )
+
+        cfg = get_current_config()
+        with patch('importlib.import_module', wraps=importlib.import_module) as imp:
+            for _ in range(3):
+                cfg.collect({
+                    'module.import.module': 'test_module.file1',
+                    'module.import.obj': 'test_module.file1.testme'
+                })
+                self.assertEqual(cfg['module.import.obj'](), 42)
+                self.assertEqual(cfg['module.import.module'].testme(), 42)
+            self.assertEqual(imp.call_count, 2)
+        sys.modules.pop('test_module.file1')
+
+    def test_lazy_imports(self):
+        Section('module.import').params(
+            module=Param(Module(lazy=True), required=True),
+            obj=Param(ImportedObject(lazy=True), required=True)
+        )
+        sys.modules.pop('test_module.file1', None)
+
+        cfg = get_current_config().collect({
+            'module.import.module': 'test_module.file1',
+            'module.import.obj': 'test_module.file1.testme'
+        })
+
+        module = cfg['module.import.module']
+        function = cfg['module.import.obj']
+        self.assertNotIn('test_module.file1', sys.modules)
+        self.assertEqual(function(), 42)
+        self.assertIn('test_module.file1', sys.modules)
+        self.assertEqual(module.testme(), 42)
+        self.assertEqual(pickle.loads(pickle.dumps(function))(), 42)
+        sys.modules.pop('test_module.file1')
+
     def test_conditional_arguments(self):
         Section('a').params(
             value=Param(int)
@@ -323,6 +406,140 @@ class TestValidation(unittest.TestCase):
 
         self.assertIn('3', str(p))
 
+    def test_validate_evaluates_conditions_once(self):
+        calls = []
+
+        def condition(cfg):
+            calls.append(1)
+            return cfg['a.enabled']
+
+        Section('a').params(
+            enabled=Param(bool, default=True)
+        )
+        Section('b').enable_if(condition).params(**{
+            f'p{i}': Param(And(int, InRange(min=0)), required=True)
+            for i in range(10)
+        })
+        Section('c').enable_if(lambda cfg: not cfg['a.enabled']).params(
+            p=Param(int, required=True)
+        )
+
+        cfg = get_current_config().collect({
+            f'b.p{i}': i - 2 for i in range(9)
+        })
+
+        errors = cfg.validate('errordict')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(list(errors.keys()),
+                         [('b', 'p0'), ('b', 'p1'), ('b', 'p9')])
+        self.assertIsInstance(errors[('b', 'p0')], ValidationError)
+        self.assertIsInstance(errors[('b', 'p9')], MissingValueError)
+        self.assertEqual(cfg['b.p5'], 3)
+        self.assertIsNone(cfg['c.p'])
+
+    def test_compiled_checkers(self):
+        class Even(Int):
+            def check(self, value):
+                value = int(value)
+                if value % 2:
+                    raise ValueError()
+                return value
+
+        checkers = [
+            Int(), Float(), Str(), Bool(), Anything(), Or(),
+            Or(int, float), Or(Even(), Str()), And(), And(int, Even()),
+            And(Or(int, float), InRange(min=0, max=10)),
+            Or(And(str, OneOf(['a', 'b'])), And(float, InRange(max=0))),
+            Or(OneOf([1]), Int()), InRange(1, 2), OneOf([1, 'a']),
+        ]
+        values = [0, 3, -2, 3.5, '4', '4.5', 'a', 'c', None, [1],
+                  float('nan'), float('inf'), True]
+
+        def outcome(function, value):
+            try:
+                return function(value)
+            except Exception as e:
+                return type(e)
+
+        for checker in checkers:
+            compiled = checker.compile()
+            self.assertIs(compiled, checker.compile())
+            help_text = checker.help()
+            for value in values:
+                expected = outcome(checker.check, value)
+                result = outcome(compiled, value)
+                self.assertEqual(repr(result), repr(expected),
+                                 f'{help_text} with {value!r}')
+                self.assertIs(type(result), type(expected))
+            self.assertEqual(checker.help(), help_text)
+
+        checker = And(Or(int, float), InRange(min=0))
+        p = Param(checker)
+        for value in ['1', 2, 3.5]:
+            p.validate(value)
+        self.assertIs(p.check, checker.compile())
+        with self.assertRaises(ValidationError):
+            p.validate(-1)
+        self.assertIsNone(pickle.loads(pickle.dumps(p)).check)
+        copy = pickle.loads(pickle.dumps(checker))
+        self.assertEqual(copy.compile()('3'), 3)
+
+    def test_list_of(self):
+        Section('sec').params(
+            ints=Param(ListOf(int)),
+            rates=Param(ListOf(And(float, InRange(0, 1))), default=[0.5]),
+            bad=Param(ListOf(int)),
+            scalar=Param(ListOf(int)),
+        )
+
+        cfg = get_current_config().collect({
+            'sec.ints': '1, 2,3',
+            'sec.bad': [1, 'x'],
+            'sec.scalar': 3,
+        })
+
+        self.assertEqual(cfg['sec.ints'], [1, 2, 3])
+        self.assertEqual(cfg['sec.rates'], [0.5])
+        errors = cfg.validate('errordict')
+        self.assertEqual(set(errors.keys()), {('sec', 'bad'), ('sec', 'scalar')})
+        self.assertEqual(ListOf(int).help(), 'a list of (an int)')
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_array_of(self):
+        Section('sec').params(
+            weights=Param(ArrayOf(np.float32, shape=(None, 2))),
+            rates=Param(And(ArrayOf(float), InRange(0, 1))),
+            listed=Param(ListOf(InRange(0, 1))),
+            cli=Param(ArrayOf(int)),
+            bad_shape=Param(ArrayOf(float, shape=(2,))),
+            bad_range=Param(And(ArrayOf(float), InRange(0, 1))),
+        )
+
+        weights = np.ones((3, 2), dtype=np.float32)
+        rates = np.linspace(0, 1, 100)
+        cfg = get_current_config().collect({
+            'sec.weights': weights,
+            'sec.rates': rates,
+            'sec.listed': rates,
+            'sec.cli': '1,2,3',
+            'sec.bad_shape': [1, 2, 3],
+            'sec.bad_range': [0.5, 1.5],
+        })
+
+        self.assertIs(cfg['sec.weights'], weights)
+        self.assertIs(cfg['sec.rates'], rates)
+        self.assertIs(cfg['sec.listed'], rates)
+        self.assertEqual(cfg['sec.cli'].tolist(), [1, 2, 3])
+        self.assertEqual(cfg['sec.cli'].dtype, np.dtype(int))
+        errors = cfg.validate('errordict')
+        self.assertEqual(set(errors.keys()),
+                         {('sec', 'bad_shape'), ('sec', 'bad_range')})
+        self.assertEqual(ArrayOf(np.float32, shape=(None, 2)).help(),
+                         'an array of float32 of shape (*, 2)')
+
+        with self.assertRaises(ValueError):
+            InRange(0, 1).compile()(np.array([0.5, 2]))
+
 
 if __name__ == '__main__':
     unittest.main()
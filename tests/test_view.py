@@ -0,0 +1,92 @@
+import unittest
+
+from fastargs import Config, set_current_config, get_current_config, Section, Param
+from fastargs.validation import Anything, Int
+
+
+class TestView(unittest.TestCase):
+    def setUp(self):
+        set_current_config(Config())
+        Section('training', 'training').params(
+            lr=Param(Anything(), default=0.1),
+            epochs=Param(Int(), default=10),
+        )
+        Section('training.optimizer', 'optimizer').params(
+            name=Param(Anything(), default='sgd'),
+        )
+        Section('data', 'data').params(
+            path=Param(Anything()),
+        )
+
+    def test_paths_under_prefix(self):
+        cfg = get_current_config()
+        self.assertEqual(list(cfg.paths('training')), [
+            ('training', 'lr'),
+            ('training', 'epochs'),
+            ('training', 'optimizer', 'name'),
+        ])
+        self.assertEqual(list(cfg.paths('nope')), [])
+        self.assertEqual(len(list(cfg.paths())), 4)
+
+    def test_section_of(self):
+        cfg = get_current_config()
+        self.assertEqual(cfg.section_of('training.optimizer.name').ns,
+                         ('training', 'optimizer'))
+        self.assertEqual(cfg.section_of('training.lr').ns, ('training',))
+        self.assertIsNone(cfg.section_of('other.value'))
+
+    def test_declared_section(self):
+        Section('x').params(**{'y.z': Param(int, default=5)})
+        Section('x.y').enable_if(lambda cfg: False).params(
+            w=Param(int, default=1)
+        )
+        cfg = get_current_config()
+        self.assertEqual(cfg['x.y.z'], 5)
+        self.assertEqual(cfg.section_of('x.y.z').ns, ('x',))
+        self.assertTrue(cfg.is_enabled('x.y.z'))
+        self.assertFalse(cfg.is_enabled('x.y.w'))
+        self.assertEqual(cfg.section_of('x.y').ns, ('x', 'y'))
+
+    def test_is_enabled(self):
+        Section('gpu', 'gpu').enable_if(
+            lambda cfg: cfg['training.epochs'] > 5
+        ).params(count=Param(Int(), default=1))
+
+        cfg = get_current_config()
+        self.assertTrue(cfg.is_enabled('gpu.count'))
+        self.assertTrue(cfg.is_enabled('data.path'))
+        cfg.collect({'training.epochs': 2})
+        self.assertFalse(cfg.is_enabled('gpu.count'))
+        self.assertIsNone(cfg['gpu.count'])
+
+    def test_view(self):
+        cfg = get_current_config().collect({
+            'training.lr': 0.5,
+            'data.path': '/tmp',
+        })
+        training = cfg.view('training')
+        self.assertEqual(training['lr'], 0.5)
+        self.assertEqual(training[('optimizer', 'name')], 'sgd')
+        self.assertIn('optimizer.name', training)
+        self.assertNotIn('path', training)
+        self.assertEqual(list(training), [
+            ('lr',), ('epochs',), ('optimizer', 'name')
+        ])
+
+        args = training.get()
+        self.assertEqual(args.lr, 0.5)
+        self.assertEqual(args.optimizer.name, 'sgd')
+        self.assertFalse(hasattr(args, 'data'))
+
+        optimizer = training.view('optimizer')
+        self.assertEqual(optimizer['name'], 'sgd')
+
+    def test_view_of_compiled_config(self):
+        cfg = get_current_config().collect({'data.path': '/tmp'})
+        compiled = cfg.compile()
+        self.assertEqual(list(compiled.paths('data')), [('data', 'path')])
+        self.assertEqual(compiled.view('training')['epochs'], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()